@@ -0,0 +1,85 @@
+# Advent of Code 2024, Batch Solving
+# (c) blu3r4y
+
+import argparse
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+import memo
+from runner import LOAD_KWARGS, PARTS, get_module, get_solver
+
+
+def solve_many(day, inputs, workers=None):
+    # each worker imports the day and runs its static setup once, and keeps
+    # input-independent caches warm from one input to the next, e.g. the
+    # solvers of day 13, the keypad tables of day 21, or the stones of day 11
+    inputs = list(inputs)
+    workers = workers or os.cpu_count()
+    chunksize = max(1, len(inputs) // (4 * workers))
+
+    with ProcessPoolExecutor(workers, initializer=get_module, initargs=(day,)) as pool:
+        days = [day] * len(inputs)
+        results = pool.map(solve_input, days, inputs, chunksize=chunksize)
+        for i, result in enumerate(results):
+            yield {"index": i, **result}
+
+
+def solve_input(day, text):
+    # a failing input only fails its own record, not the whole batch
+    try:
+        return solve_parts(day, text)
+    except Exception as e:
+        return {"day": day, "error": repr(e)}
+    finally:
+        # caches of closures are specific to this input, so drop them
+        memo.clear_all(keep_warm=True)
+
+
+def solve_parts(day, text):
+    # parse directly, the inputs are not cached, so only parsing is timed
+    load = get_module(day).load
+
+    answers, load_ms, solve_ms = [], [], []
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for part in PARTS[day]:
+            solver = inspect.unwrap(get_solver(day, part))
+
+            start = time.perf_counter()
+            data = load(text, **LOAD_KWARGS.get((day, part), {}))
+            loaded = time.perf_counter()
+            answers.append(solver(data))
+            solved = time.perf_counter()
+
+            load_ms.append((loaded - start) * 1000)
+            solve_ms.append((solved - loaded) * 1000)
+
+    return {"day": day, "answers": answers, "load_ms": load_ms, "solve_ms": solve_ms}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="solve many inputs of one day")
+    parser.add_argument("day", type=int)
+    parser.add_argument("inputs", nargs="+", help="input files")
+    parser.add_argument("-w", "--workers", type=int, help="number of processes")
+    args = parser.parse_args()
+
+    texts = []
+    for path in args.inputs:
+        with open(path) as f:
+            texts.append(f.read().rstrip("\r\n"))
+
+    failed = False
+    for result in solve_many(args.day, texts, args.workers):
+        failed |= "error" in result
+        print(json.dumps({"path": args.inputs[result["index"]], **result}), flush=True)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
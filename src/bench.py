@@ -0,0 +1,242 @@
+# Advent of Code 2024, Benchmarks
+# (c) blu3r4y
+
+import argparse
+import gc
+import inspect
+import json
+import math
+import os
+import statistics
+import time
+import tracemalloc
+import unicodedata
+from contextlib import redirect_stdout
+
+import memo
+from runner import (
+    DAYS,
+    LOAD_KWARGS,
+    PARTS,
+    SETUP,
+    get_input,
+    get_module,
+    get_solver,
+    load_part,
+)
+
+README = os.path.join(os.path.dirname(__file__), "..", "README.md")
+
+# the genetic algorithm takes minutes, so don't run it by default
+SKIP = {(17, 2)}
+
+
+def benchmark(day, part, text, repeat=10, warmup=1):
+    # time the bare solver, without the printing decorators
+    solver = inspect.unwrap(get_solver(day, part))
+
+    timings = []
+    for i in range(warmup + repeat):
+        answer, elapsed, caches, _ = run_once(solver, day, part, text)
+        if i >= warmup:
+            timings.append(elapsed * 1000)
+
+    # tracing allocations slows down the solver, so memory is measured separately
+    _, _, _, peak = run_once(solver, day, part, text, trace_memory=True)
+
+    return {
+        "day": day,
+        "part": part,
+        "answer": answer,
+        "runs": repeat,
+        "min_ms": min(timings),
+        "median_ms": statistics.median(timings),
+        "p95_ms": percentile(timings, 95),
+        "peak_kb": peak / 1024,
+        "caches": caches,  # of the last run
+    }
+
+
+def run_once(solver, day, part, text, trace_memory=False):
+    # every run starts from fresh data and cold caches,
+    # since some solvers modify their input in-place
+    clear_caches(day)
+    data = load_part(day, part, text)
+
+    gc.collect()
+    gc.disable()
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with memo.scoped():
+            start = time.perf_counter()
+            answer = solver(data)
+            elapsed = time.perf_counter() - start
+            caches = memo.stats(f"day{day}")
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    return answer, elapsed, caches, peak
+
+
+def benchmark_load(day, part, text, repeat=10, warmup=1):
+    # time parsing alone, bypassing the cache of parsed inputs
+    load, kwargs = get_module(day).load, LOAD_KWARGS.get((day, part), {})
+
+    timings = []
+    for i in range(warmup + repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            load(text, **kwargs)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+
+        if i >= warmup:
+            timings.append(elapsed * 1000)
+
+    return {
+        "day": day,
+        "part": part,
+        "stage": "load",
+        "input_kb": len(text) / 1024,
+        "runs": repeat,
+        "min_ms": min(timings),
+        "median_ms": statistics.median(timings),
+        "p95_ms": percentile(timings, 95),
+    }
+
+
+def clear_caches(day):
+    module = get_module(day)
+    for name, obj in vars(module).items():
+        # keep the static setup, it is not part of the solution
+        if hasattr(obj, "cache_clear") and name != SETUP.get(day):
+            obj.cache_clear()
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+
+def benchmark_all(
+    days, repeat=10, warmup=1, input_dir=None, skip=SKIP, load=False, scale=None
+):
+    for day in days:
+        text = get_input(day, input_dir) if scale is None else generate(day, scale)
+        for part in PARTS[day]:
+            if (day, part) in skip:
+                continue
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                run = benchmark_load if load else benchmark
+                result = run(day, part, text, repeat, warmup)
+            yield result
+
+
+def generate(day, scale):
+    from generators import generate
+
+    return generate(day, scale)
+
+
+def update_readme(results, path=README):
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().split("\n")
+
+    durations = dict()
+    for r in results:
+        durations[r["day"], r["part"]] = format_duration(r["median_ms"])
+
+    # the puzzle table is the first table in the readme
+    start = next(i for i, line in enumerate(lines) if line.startswith("|"))
+    end = start
+    while end < len(lines) and lines[end].startswith("|"):
+        end += 1
+
+    header, aligns, *rows = [split_row(line) for line in lines[start:end]]
+    cols = {1: header.index("⏳ Duration A"), 2: header.index("⏳ Duration B")}
+    for row in rows:
+        for part, col in cols.items():
+            if (int(row[0]), part) in durations:
+                row[col] = durations[int(row[0]), part]
+
+    lines[start:end] = format_table(header, aligns, rows)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+
+def format_duration(ms):
+    if ms < 10:
+        return "-"
+    if ms >= 60_000:
+        return f"**{ms / 60_000:.0f} min**"
+    return f"{ms:,.0f} ms".replace(",", ".")
+
+
+def split_row(line):
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def format_table(header, aligns, rows):
+    ncols = len(header)
+    widths = [
+        max(3, *(text_width(r[c]) for r in [header, *rows])) for c in range(ncols)
+    ]
+    right = [a.endswith(":") and not a.startswith(":") for a in aligns]
+
+    def _format(cells):
+        padded = []
+        for cell, width, r in zip(cells, widths, right):
+            fill = " " * (width - text_width(cell))
+            padded.append(fill + cell if r else cell + fill)
+        return "| " + " | ".join(padded) + " |"
+
+    separator = [
+        ("-" * (w - 1) + ":") if r else (":" + "-" * (w - 1))
+        for w, r in zip(widths, right)
+    ]
+    return [_format(header), _format(separator), *map(_format, rows)]
+
+
+def text_width(text):
+    # emojis take up two columns
+    return sum(2 if unicodedata.east_asian_width(c) in "WF" else 1 for c in text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark the solvers")
+    parser.add_argument("days", nargs="*", type=int, default=DAYS)
+    parser.add_argument("-n", "--repeat", type=int, default=10, help="timed runs")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs")
+    parser.add_argument("-i", "--inputs", help="directory with dayN.txt input files")
+    parser.add_argument("--all", action="store_true", help="also run skipped parts")
+    parser.add_argument("--readme", action="store_true", help="update the readme")
+    parser.add_argument("--load", action="store_true", help="only time parsing")
+    parser.add_argument("-s", "--scale", type=int, help="use generated inputs")
+    args = parser.parse_args()
+
+    skip = set() if args.all else SKIP
+    results = []
+    for result in benchmark_all(
+        args.days,
+        args.repeat,
+        args.warmup,
+        args.inputs,
+        skip,
+        load=args.load,
+        scale=args.scale,
+    ):
+        print(json.dumps(result), flush=True)
+        results.append(result)
+
+    if args.readme and not (args.load or args.scale):
+        update_readme(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# Advent of Code 2024, Solver Daemon
+# (c) blu3r4y
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+import traceback
+
+from runner import DAYS, PARTS, get_input, get_module, run_part
+
+# requests and responses are json lines, loosely following json-rpc, e.g.
+# {"id": 1, "method": "solve", "params": {"day": 6, "part": 1, "input": "..."}}
+# {"id": 1, "result": {"day": 6, "part": 1, "answer": 41, ...}}
+
+
+def preload(days=DAYS):
+    # import all days and run their static setup once
+    failed = {}
+    for day in days:
+        try:
+            get_module(day)
+        except Exception as e:
+            failed[day] = repr(e)
+    return failed
+
+
+def handle(request, state):
+    method, params = request.get("method"), request.get("params", {})
+
+    if method == "ping":
+        return {"uptime_s": time.monotonic() - state["started"]}
+    if method == "status":
+        return {"days": state["days"], "failed": state["failed"]}
+    if method == "solve":
+        return solve(**params)
+    if method == "shutdown":
+        state["running"] = False
+        return {}
+
+    raise ValueError(f"unknown method {method!r}")
+
+
+def solve(day, part, input=None, path=None):
+    if part not in PARTS.get(day, ()):
+        raise ValueError(f"there is no part {part} of day {day}")
+
+    # the input is given inline, as a file, or taken from the input store
+    if input is None and path is not None:
+        with open(path) as f:
+            input = f.read().rstrip("\r\n")
+    if input is None:
+        input = get_input(day)
+
+    return run_part(day, part, input)
+
+
+def respond(line, state):
+    request = None
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError(f"requests must be objects, got {request!r}")
+        return {"id": request.get("id"), "result": handle(request, state)}
+    except Exception as e:
+        traceback.print_exc(file=sys.stderr)
+        rid = request.get("id") if isinstance(request, dict) else None
+        return {"id": rid, "error": {"message": repr(e)}}
+
+
+def serve_stdio(state):
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        print(json.dumps(respond(line, state)), flush=True)
+        if not state["running"]:
+            break
+
+
+def serve_socket(path, state):
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                response = respond(line, state)
+                self.wfile.write(json.dumps(response).encode() + b"\n")
+                if not state["running"]:
+                    break
+
+    # one request at a time, the solvers share module state
+    if os.path.exists(path):
+        os.unlink(path)
+    with socketserver.UnixStreamServer(path, Handler) as server:
+        try:
+            while state["running"]:
+                server.handle_request()
+        finally:
+            os.unlink(path)
+
+
+def call(address, method, **params):
+    # send a single request to a daemon listening on a unix socket
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(address)
+        with sock.makefile("rwb") as f:
+            request = {"id": 0, "method": method, "params": params}
+            f.write(json.dumps(request).encode() + b"\n")
+            f.flush()
+            response = json.loads(f.readline())
+
+    if "error" in response:
+        raise RuntimeError(response["error"]["message"])
+    return response["result"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="serve solve requests from memory")
+    parser.add_argument("days", nargs="*", type=int, default=DAYS, help="to preload")
+    parser.add_argument("-s", "--socket", help="unix socket, instead of stdin/stdout")
+    args = parser.parse_args()
+
+    state = {
+        "days": args.days,
+        "failed": preload(args.days),
+        "started": time.monotonic(),
+        "running": True,
+    }
+    print(f"ready, {len(args.days) - len(state['failed'])} days", file=sys.stderr)
+
+    if args.socket:
+        serve_socket(args.socket, state)
+    else:
+        serve_stdio(state)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,41 @@
 # Advent of Code 2024, Day 1
 # (c) blu3r4y
 
+import heapq
+import os
+import tempfile
 from collections import Counter
+from itertools import islice
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+import numpy as np
 
+from tracing import trace
 
-@print_calls
-@print_durations(unit="ms")
+# lines per chunk when streaming inputs that don't fit into memory
+CHUNK_LINES = 1 << 20
+
+
+@trace
 def part1(data):
+    left, right = data
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
+
+
+@trace
+def part2(data):
+    left, right = data
+
+    # count the location ids, which are small and non-negative, by value
+    counts = np.bincount(right)
+    found = left < len(counts)
+
+    # summed in python ints, since the similarity grows with the square of the
+    # number of lines and could overflow int64 for huge lists
+    return sum((left * counts[left.clip(max=len(counts) - 1)] * found).tolist())
+
+
+def part1_loop(data):
+    # the plain python version, for comparison
     left, right = data
     left, right = sorted(left), sorted(right)
 
@@ -20,9 +46,8 @@ def part1(data):
     return distances
 
 
-@print_calls
-@print_durations(unit="ms")
-def part2(data):
+def part2_loop(data):
+    # the plain python version, for comparison
     left, right = data
     counts = Counter(right)
 
@@ -33,7 +58,62 @@ def part2(data):
     return similarity
 
 
+@trace
+def part1_streaming(path, lines=CHUNK_LINES):
+    # an external merge sort, the sorted chunks are spilled to disk as runs,
+    # which are merged lazily, with only one block per run in memory at a time
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = ([], [])
+        for i, chunk in enumerate(read_chunks(path, lines)):
+            for side, values in enumerate(chunk):
+                runs[side].append(os.path.join(tmp, f"{side}-{i}.npy"))
+                np.save(runs[side][-1], np.sort(values))
+
+        left, right = (heapq.merge(*map(read_run, paths)) for paths in runs)
+        return sum(abs(l - r) for l, r in zip(left, right))
+
+
+@trace
+def part2_streaming(path, lines=CHUNK_LINES):
+    # only the number of occurrences of each location id is kept
+    left, right = np.zeros(0, np.int64), np.zeros(0, np.int64)
+    for l, r in read_chunks(path, lines):
+        left, right = add_counts(left, l), add_counts(right, r)
+
+    # ids on both sides, summed in python ints, since even the product of two
+    # counts could overflow int64 for huge lists
+    n = min(len(left), len(right))
+    ids = np.flatnonzero((left[:n] > 0) & (right[:n] > 0))
+    counts = zip(ids.tolist(), left[ids].tolist(), right[ids].tolist())
+    return sum(i * l * r for i, l, r in counts)
+
+
+def read_chunks(path, lines=CHUNK_LINES):
+    with open(path) as f:
+        while chunk := "".join(islice(f, lines)):
+            numbers = np.fromstring(chunk, dtype=np.int64, sep=" ")
+            yield numbers[0::2], numbers[1::2]
+
+
+def read_run(path, block=1 << 16):
+    run = np.load(path, mmap_mode="r")
+    for i in range(0, len(run), block):
+        yield from run[i : i + block].tolist()
+
+
+def add_counts(counts, values):
+    result = np.bincount(values, minlength=len(counts))
+    result[: len(counts)] += counts
+    return result
+
+
 def load(data):
+    # both lists in one pass, since any whitespace separates the numbers
+    numbers = np.fromstring(data, dtype=np.int64, sep=" ")
+    return numbers[0::2], numbers[1::2]
+
+
+def load_lists(data):
     pairs = []
     for line in data.splitlines():
         nums = map(int, line.split())
@@ -42,12 +122,19 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=1)
+    import sys
+
+    from store import check_answer, read_input
+
+    if len(sys.argv) > 1:
+        # stream a location list that may be larger than memory
+        print(part1_streaming(sys.argv[1]), part2_streaming(sys.argv[1]))
+        sys.exit()
+
+    data = read_input(1)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 1765812
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(1, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 20520794
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(1, 2, ans2)
@@ -1,82 +1,67 @@
 # Advent of Code 2024, Day 10
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from grid import directions, find, parse_grid
+from tracing import trace
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(data):
-    graph, limits = data
-    return solve(graph, limits, distinct_ends=True)
+    return solve(data, distinct_ends=True)
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data):
-    graph, limits = data
-    return solve(graph, limits)
+    return solve(data)
 
 
-def solve(graph, limits, distinct_ends=False):
+def solve(grid, distinct_ends=False):
+    cells, offsets = grid.cells.tolist(), directions(grid)
+
     num_distinct = 0
-    for th in find_trailheads(graph):
-        paths = traverse(th, graph, limits)
+    for th in find(grid, "0").tolist():
+        # every path ends in its own leaf, so the ends of all paths
+        # are only distinct if we drop the duplicates
+        ends = traverse(th, cells, offsets)
         if distinct_ends:  # only count end points
-            paths = {path[-1] for path in paths}
+            ends = set(ends)
 
-        num_distinct += len(paths)
+        num_distinct += len(ends)
 
     return num_distinct
 
 
-def find_trailheads(graph):
-    return [k for k, v in graph.items() if v == 0]
-
-
-def traverse(start, graph, limits, paths=0, currpath=None):
-    paths = paths or set()
-    currpath = (start,) if currpath is None else currpath + (start,)
-
-    # check if we reached the end
-    if graph[start] == 9:
-        return paths | {currpath}
+def traverse(start, cells, offsets):
+    ends = []
 
-    # check and branch to neighbors
-    curr = graph[start]
-    for pos in neighbors(start, limits):
-        if graph[pos] != curr + 1:
-            continue  # must increment by 1
-        paths |= traverse(pos, graph, limits, paths, currpath)
+    stack = [start]
+    while stack:
+        pos = stack.pop()
 
-    return paths
+        # check if we reached the end
+        if cells[pos] == ord("9"):
+            ends.append(pos)
+            continue
 
+        # check and branch to neighbors, the border never matches
+        for off in offsets:
+            if cells[pos + off] == cells[pos] + 1:  # must increment by 1
+                stack.append(pos + off)
 
-def neighbors(pos, limits):
-    points = (pos + d for d in [1, -1, 1j, -1j])
-    return (p for p in points if 0 <= p.real < limits[1] and 0 <= p.imag < limits[0])
+    return ends
 
 
 def load(data):
-    graph = dict()
-
-    rows = data.splitlines()
-    for r, row in enumerate(data.splitlines()):
-        for c, cell in enumerate(row):
-            graph[complex(c, r)] = int(cell)
-
-    limits = len(rows), len(rows[0])
-    return graph, limits
+    return parse_grid(data)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=10)
+    from store import check_answer, read_input
+
+    data = read_input(10)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 688
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(10, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 1459
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(10, 2, ans2)
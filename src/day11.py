@@ -1,25 +1,21 @@
 # Advent of Code 2024, Day 11
 # (c) blu3r4y
 
-from functools import cache
+from memo import memo
+from tracing import trace
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
 
-
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(stones):
     return sum(blink(stone, n=25) for stone in stones)
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(stones):
     return sum(blink(stone, n=75) for stone in stones)
 
 
-@cache
+@memo(maxsize=2**18)
 def blink(stone, n=1):
     if n == 0:
         return 1
@@ -32,7 +28,7 @@ def blink(stone, n=1):
     return blink(result, n - 1)
 
 
-@cache
+@memo(maxsize=2**13)
 def transform(stone):
     if stone == 0:
         return 1
@@ -51,12 +47,12 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=11)
+    from store import check_answer, read_input
+
+    data = read_input(11)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 183435
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(11, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 218279375708592
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(11, 2, ans2)
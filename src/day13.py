@@ -1,35 +1,38 @@
 # Advent of Code 2024, Day 13
 # (c) blu3r4y
 
+import re
 from collections import namedtuple
 from functools import cache, partial
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
-from parse import parse
-from sympy import Eq, lambdify, solve, symbols
+from parallel import map_chunks
+from tracing import trace
 
 COST_A, COST_B = 3, 1
 INC = 10000000000000
 
+NUMBER = re.compile(r"\d+")
+
 Point = namedtuple("Point", ["x", "y"])
 Game = namedtuple("Game", ["a", "b", "prize"])
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(games):
     return compute_costs(games)
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(games):
     games = [Game(g.a, g.b, Point(g.prize.x + INC, g.prize.y + INC)) for g in games]
     return compute_costs(games)
 
 
 def compute_costs(games):
+    return sum(map_chunks(sum_costs, games))
+
+
+def sum_costs(games):
     costs = 0
 
     get_n, get_m = generate_solvers()
@@ -42,15 +45,12 @@ def compute_costs(games):
 
 
 def load(data):
-    blocks = data.split("\n\n")
+    # each block has exactly six numbers, for the buttons a and b and the prize
+    numbers = list(map(int, NUMBER.findall(data)))
     games = []
 
-    for block in blocks:
-        a, b, p = block.splitlines()
-        ax, ay = parse("Button A: X+{:d}, Y+{:d}", a)
-        bx, by = parse("Button B: X+{:d}, Y+{:d}", b)
-        px, py = parse("Prize: X={:d}, Y={:d}", p)
-
+    for i in range(0, len(numbers), 6):
+        ax, ay, bx, by, px, py = numbers[i : i + 6]
         game = Game(Point(ax, ay), Point(bx, by), Point(px, py))
         games.append(game)
 
@@ -59,6 +59,8 @@ def load(data):
 
 @cache
 def generate_solvers():
+    from sympy import Eq, lambdify, solve, symbols
+
     px, py, ax, ay, bx, by, n, m = symbols("px py ax ay bx by n m", integer=True)
 
     eq = [Eq(px, n * ax + m * bx), Eq(py, n * ay + m * by)]
@@ -79,15 +81,15 @@ def generate_solvers():
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=13)
+    from store import check_answer, read_input
+
+    data = read_input(13)
 
     # cache the solvers (static, regardless of input)
     generate_solvers()
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 30973
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(13, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 95688837203288
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(13, 2, ans2)
@@ -1,51 +1,44 @@
 # Advent of Code 2024, Day 14
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import count, print_calls, print_durations
-from parse import parse
+import re
 
+import numpy as np
+from funcy import count
 
-@print_calls
-@print_durations(unit="ms")
+from grid import format_grid, new_grid, to_array
+from tracing import trace
+
+NUMBER = re.compile(r"-?\d+")
+
+
+@trace
 def part1(robots, w=101, h=103):
-    for _ in range(100):
-        robots = move(robots, w, h)
+    robots = move(robots, w, h, steps=100)
 
     q1, q2, q3, q4 = count_quadrants(robots, w, h)
     return q1 * q2 * q3 * q4
 
 
-def move(robots, w, h):
-    for i, (pos, vel) in enumerate(robots):
-        pos = wrap(pos + vel, w, h)
-        robots[i] = (pos, vel)
-    return robots
-
-
-def wrap(pos, w, h):
-    return complex(pos.real % w, pos.imag % h)
+def move(robots, w, h, steps=1):
+    pos, vel = robots
+    return (pos + steps * vel) % (w, h), vel
 
 
 def count_quadrants(robots, w, h):
+    x, y = robots[0].T
     midx, midy = w // 2, h // 2
 
-    q1, q2, q3, q4 = 0, 0, 0, 0
-    for pos, _ in robots:
-        if pos.real < midx and pos.imag < midy:
-            q1 += 1
-        elif pos.real > midx and pos.imag < midy:
-            q2 += 1
-        elif pos.real < midx and pos.imag > midy:
-            q3 += 1
-        elif pos.real > midx and pos.imag > midy:
-            q4 += 1
+    left, right, top, bottom = x < midx, x > midx, y < midy, y > midy
+    q1 = np.count_nonzero(left & top)
+    q2 = np.count_nonzero(right & top)
+    q3 = np.count_nonzero(left & bottom)
+    q4 = np.count_nonzero(right & bottom)
 
-    return q1, q2, q3, q4
+    return int(q1), int(q2), int(q3), int(q4)
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(robots, w=101, h=103):
     for i in count(1):
         robots = move(robots, w, h)
@@ -54,61 +47,44 @@ def part2(robots, w=101, h=103):
 
 
 def tree_heuristic(robots, w, h):
-    grid = make_grid(robots, w, h)
-
-    # find the maximum number of consecutive robots for each column
-    # so that we can identify long vertical lines of robots
-    maxspans = []
-    for y in range(h):
-        spans = [0]
-        for x in range(w):
-            if grid[y][x] > 0:
-                spans[-1] += 1
-            else:
-                spans.append(0)
+    occupied = to_array(make_grid(robots, w, h)) == ord("#")
 
-        maxspans.append(max(spans))
+    # find the rows that have at least 5 consecutive robots,
+    # by checking 5 horizontally shifted copies of the grid at once
+    spans = occupied[:, : w - 4].copy()
+    for shift in range(1, 5):
+        spans &= occupied[:, shift : w - 4 + shift]
 
-    # heuristic to find at least 3 vertical lines (each larger than 5)
-    # to hopefully identify a christmas tree, made up of long vertical lines
-    return sum(1 for s in maxspans if s >= 5) >= 3
+    # heuristic to find at least 3 lines (each at least 5 long)
+    # to hopefully identify a christmas tree, made up of long lines
+    return np.count_nonzero(spans.any(axis=1)) >= 3
 
 
 def make_grid(robots, w, h):
-    grid = [[0] * w for _ in range(h)]
-    for pos, _ in robots:
-        grid[int(pos.imag)][int(pos.real)] += 1
+    grid = new_grid(w, h)
+    x, y = robots[0].T
+    to_array(grid)[y, x] = ord("#")
     return grid
 
 
 def load(data):
-    robots = []
-    for line in data.splitlines():
-        p, v = parse("p={} v={}", line)
-        px, py = map(int, p.split(","))
-        vx, vy = map(int, v.split(","))
-        robots.append(((px + py * 1j), (vx + vy * 1j)))
-    return robots
+    # four numbers per line, the position and the velocity
+    numbers = list(map(int, NUMBER.findall(data)))
+    robots = np.array(numbers, dtype=np.int64).reshape(-1, 4)
+    return robots[:, :2], robots[:, 2:]
 
 
 def print_grid(robots, w, h):
-    grid = make_grid(robots, w, h)
-
-    lines = []
-    for row in grid:
-        lines.append("".join("#" if num > 0 else "." for num in row))
-    image = "\n".join(lines)
-
-    print(image)
+    print(format_grid(make_grid(robots, w, h)))
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=14)
+    from store import check_answer, read_input
+
+    data = read_input(14)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 224554908
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(14, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 6644
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(14, 2, ans2)
@@ -1,105 +1,108 @@
 # Advent of Code 2024, Day 15
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+import numpy as np
 
-ROBOT, BOX, WALL, EMPTY = "@", "O", "#", "."
-BOX_START, BOX_END = "[", "]"
+from grid import SENTINEL, coords, directions, find, format_grid, parse_grid
+from tracing import trace
 
+ROBOT, BOX, WALL, EMPTY = b"@O#."
+BOX_START, BOX_END = b"[]"
 
-@print_calls
-@print_durations(unit="ms")
+# each cell is twice as wide in the second part
+ENLARGED = {"#": "##", "O": "[]", ".": "..", "@": "@."}
+
+
+@trace
 def part1(data):
-    grid, moves, robot, _ = data
+    grid, moves, robot = data
+    cells = bytearray(grid.cells)
     for move in moves:
-        grid, robot = perform_simple_move(grid, robot, move)
+        robot = perform_simple_move(cells, robot, move)
 
-    return score_boxes(grid)
+    return score_boxes(grid, cells)
 
 
-def perform_simple_move(grid, oldpos, move):
+def perform_simple_move(cells, oldpos, move):
     pos = oldpos + move
-    if grid.get(pos) == WALL:
-        return grid, oldpos  # blocked
+    if cells[pos] in (WALL, SENTINEL):
+        return oldpos  # blocked
 
     # find the last box in the direction of the move
     lastbox = oldpos
-    while grid.get(lastbox + move) in (BOX, BOX_START, BOX_END):
+    while cells[lastbox + move] in (BOX, BOX_START, BOX_END):
         lastbox += move
-    if grid.get(lastbox + move) == WALL:
-        return grid, oldpos  # cannot push
+    if cells[lastbox + move] in (WALL, SENTINEL):
+        return oldpos  # cannot push
 
     # move all boxes
     while lastbox != oldpos:
-        grid[lastbox + move] = grid[lastbox]
-        del grid[lastbox]
+        cells[lastbox + move] = cells[lastbox]
         lastbox -= move
 
     # move the robot
-    grid[pos] = ROBOT
-    del grid[oldpos]
+    cells[pos] = ROBOT
+    cells[oldpos] = EMPTY
 
-    return grid, pos
+    return pos
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data):
-    grid, moves, robot, _ = data
+    grid, moves, robot = data
+    cells = bytearray(grid.cells)
     for move in moves:
-        assert move is not None
-        grid, robot = perform_complex_move(grid, robot, move)
+        robot = perform_complex_move(cells, robot, move)
 
-    return score_boxes(grid)
+    return score_boxes(grid, cells)
 
 
-def perform_complex_move(grid, oldpos, move):
+def perform_complex_move(cells, oldpos, move):
     # use simple logic for horizontal moves
-    if abs(move.real) > 0:
-        return perform_simple_move(grid, oldpos, move)
+    if abs(move) == 1:
+        return perform_simple_move(cells, oldpos, move)
 
     # collect all boxes in the direction of the move, if any
-    boxes = collect_boxes(grid, oldpos + move, move)
+    boxes = collect_boxes(cells, oldpos + move, move)
     if boxes is None:
-        return grid, oldpos  # cannot push
+        return oldpos  # cannot push
 
     # clear, then move all boxes
     for box in boxes:
-        grid[box] = EMPTY
-        grid[box + 1] = EMPTY
+        cells[box] = EMPTY
+        cells[box + 1] = EMPTY
     for box in boxes:
-        grid[box + move] = BOX_START
-        grid[box + 1 + move] = BOX_END
+        cells[box + move] = BOX_START
+        cells[box + 1 + move] = BOX_END
 
     # move the robot
     pos = oldpos + move
-    grid[pos] = ROBOT
-    del grid[oldpos]
+    cells[pos] = ROBOT
+    cells[oldpos] = EMPTY
 
-    return grid, pos
+    return pos
 
 
-def collect_boxes(grid, pos, move, boxes=None):
+def collect_boxes(cells, pos, move, boxes=None):
     boxes = boxes or list()
 
     # cannot push, invalid end position
-    if grid.get(pos) == WALL:
+    if cells[pos] in (WALL, SENTINEL):
         return None
 
     # valid end position, return collected boxes, if any
-    if grid.get(pos, EMPTY) == EMPTY:
+    if cells[pos] == EMPTY:
         return boxes
 
     # touching other boxes, continue collecting
-    if grid.get(pos) in (BOX_START, BOX_END):
-        if grid.get(pos) == BOX_END:
+    if cells[pos] in (BOX_START, BOX_END):
+        if cells[pos] == BOX_END:
             pos -= 1
 
         # collect boxes to the left and right of the current box
         left, right = pos + move, pos + 1 + move
-        left_boxes = collect_boxes(grid, left, move, boxes + [pos])
-        right_boxes = collect_boxes(grid, right, move, boxes + [pos])
+        left_boxes = collect_boxes(cells, left, move, boxes + [pos])
+        right_boxes = collect_boxes(cells, right, move, boxes + [pos])
 
         # cannot push, because at least one path is blocked
         if not left_boxes or not right_boxes:
@@ -108,11 +111,12 @@ def collect_boxes(grid, pos, move, boxes=None):
         return boxes + left_boxes + right_boxes
 
 
-def score_boxes(grid):
+def score_boxes(grid, cells):
     score = 0
-    for pos, cell in grid.items():
+    for pos, cell in enumerate(cells):
         if cell == BOX or cell == BOX_START:
-            score += 100 * int(pos.imag) + int(pos.real)
+            x, y = coords(grid, pos)
+            score += 100 * y + x
     return score
 
 
@@ -121,46 +125,29 @@ def load(data, large=False):
     block_b = block_b.replace("\n", "")
 
     if large:  # enlarge the grid for the second part
-        block_a = block_a.replace(WALL, WALL + WALL)
-        block_a = block_a.replace(BOX, BOX_START + BOX_END)
-        block_a = block_a.replace(EMPTY, EMPTY + EMPTY)
-        block_a = block_a.replace(ROBOT, ROBOT + EMPTY)
-
-    gridlines = block_a.splitlines()
-
-    grid, robot = dict(), None
-    for r, row in enumerate(gridlines):
-        for c, cell in enumerate(row):
-            pos = complex(c, r)
-            if cell == EMPTY:
-                continue
-            if cell == ROBOT:
-                robot = pos
-            grid[pos] = cell
-
-    mapping = {"^": -1j, "v": 1j, "<": -1, ">": 1}
+        block_a = "".join(ENLARGED.get(c, c) for c in block_a)
+
+    grid = parse_grid(block_a)
+    robot = int(find(grid, chr(ROBOT))[0])
+
+    mapping = dict(zip("^>v<", directions(grid)))
     moves = tuple(map(mapping.get, block_b))
 
-    limits = len(gridlines[0]), len(gridlines)
-    return grid, moves, robot, limits
+    return grid, moves, robot
 
 
-def print_grid(grid, limits):
-    width, height = limits
-    for r in range(height):
-        for c in range(width):
-            pos = complex(c, r)
-            print(grid.get(pos, EMPTY), end="")
-        print()
+def print_grid(grid, cells):
+    cells = np.frombuffer(cells, dtype=np.uint8)
+    print(format_grid(grid._replace(cells=cells)))
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=15)
+    from store import check_answer, read_input
+
+    data = read_input(15)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 1478649
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(15, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data, large=True))
-    assert ans2 == 1495455
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data, large=True))
+    check_answer(15, 2, ans2)
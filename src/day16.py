@@ -1,114 +1,77 @@
 # Advent of Code 2024, Day 16
 # (c) blu3r4y
 
-import networkx as nx
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from grid import SENTINEL, directions, find, parse_grid
+from search import dijkstra, shortest_path_nodes
+from tracing import trace
 
 START, END, WALL, EMPTY = "S", "E", "#", "."
 
-NORTH, SOUTH, EAST, WEST = -1j, 1j, 1, -1
-TURN_RIGHT, TURN_LEFT = 1j, -1j
+# indices into the clockwise offsets of the grid
+NORTH, EAST, SOUTH, WEST = range(4)
+TURN_RIGHT, TURN_LEFT = 1, 3
 
 STEP_COST, TURN_COST = 1, 1000
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(data):
-    walls, start, end, limits = data
-    graph = build_graph(walls, limits)
+    grid, start, end = data
+    dist, _ = find_best_paths(grid, start, end)
 
-    score, _ = find_best_paths(graph, start, end)
-    return score
+    return min(dist[node(end, orient)] for orient in range(4))
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data):
-    walls, start, end, limits = data
-    graph = build_graph(walls, limits)
+    grid, start, end = data
+    dist, preds = find_best_paths(grid, start, end)
 
-    _, paths = find_best_paths(graph, start, end)
-
-    # all unique positions on any best path
-    vistas = set()
-    for path in paths:
-        vistas.update((p for p, _ in path))
+    # all unique positions on any best path, ending in any orientation
+    best_score = min(dist[node(end, orient)] for orient in range(4))
+    ends = [node(end, o) for o in range(4) if dist[node(end, o)] == best_score]
+    vistas = {n // 4 for n in shortest_path_nodes(preds, ends)}
     return len(vistas)
 
 
-def find_best_paths(graph, start, end):
-    paths, scores = [], []
-
-    # get all shortest paths, ending in any orientation
-    for orient in [NORTH, SOUTH, EAST, WEST]:
-        it = nx.all_shortest_paths(graph, (start, EAST), (end, orient), "weight")
-        for path in it:
-            paths.append(path)
-            scores.append(path_score(path))
-
-    best_score = min(scores)
-    best_paths = [p for p, s in zip(paths, scores) if s == best_score]
-    return best_score, best_paths
-
-
-def path_score(path):
-    score = 0
-    for (_, a), (_, b) in zip(path, path[1:]):
-        score += STEP_COST if a == b else TURN_COST
-    return score
+def find_best_paths(grid, start, end):
+    cells, offsets = grid.cells.tolist(), directions(grid)
+    blocked = (ord(WALL), SENTINEL)
 
+    def neighbors(curr):
+        pos, orient = divmod(curr, 4)
 
-def build_graph(walls, limits):
-    width, height = limits
+        # allow moving forward in this orientation
+        if cells[pos + offsets[orient]] not in blocked:
+            yield node(pos + offsets[orient], orient), STEP_COST
 
-    graph = nx.DiGraph()
-    for h in range(height):
-        for w in range(width):
-            pos = complex(w, h)
-            if pos in walls:
-                continue
+        # allow turning right or left on the spot
+        for turn in [TURN_RIGHT, TURN_LEFT]:
+            yield node(pos, (orient + turn) % 4), TURN_COST
 
-            for orient in [NORTH, SOUTH, EAST, WEST]:
-                curr = (pos, orient)
+    # get the shortest paths to the end, in any orientation
+    sources, targets = [node(start, EAST)], [node(end, o) for o in range(4)]
+    return dijkstra(sources, neighbors, 4 * len(cells), targets)
 
-                # allow moving forward in this orientation
-                if pos + orient not in walls:
-                    graph.add_edge(curr, (pos + orient, orient), weight=STEP_COST)
 
-                # allow turning right or left on the spot
-                for turn in [TURN_RIGHT, TURN_LEFT]:
-                    graph.add_edge(curr, (pos, orient * turn), weight=TURN_COST)
-
-    return graph
+def node(pos, orient):
+    # each position is split into one node per orientation
+    return 4 * pos + orient
 
 
 def load(data):
-    walls, start, end = set(), None, None
-
-    rows = data.splitlines()
-    for r, row in enumerate(rows):
-        for c, cell in enumerate(row):
-            pos = complex(c, r)
-            if cell == START:
-                start = pos
-            if cell == END:
-                end = pos
-            if cell == WALL:
-                walls.add(pos)
-
-    limits = len(rows[0]), len(rows)
-    return walls, start, end, limits
+    grid = parse_grid(data)
+    start, end = int(find(grid, START)[0]), int(find(grid, END)[0])
+    return grid, start, end
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=16)
+    from store import check_answer, read_input
+
+    data = read_input(16)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 88416
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(16, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 442
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(16, 2, ans2)
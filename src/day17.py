@@ -2,14 +2,16 @@
 # (c) blu3r4y
 
 import random
+import re
 
-from aocd.models import Puzzle
-from funcy import count, print_calls, print_durations
-from parse import parse
+from funcy import count
 
+from tracing import trace
 
-@print_calls
-@print_durations(unit="ms")
+NUMBER = re.compile(r"\d+")
+
+
+@trace
 def part1(data):
     program, a, b, c = data
     result = interpret(program, a, b, c)
@@ -59,14 +61,14 @@ def interpret(program: list[int], a: int, b: int, c: int) -> list[int]:
     return output
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data, verbose=True):
     program, _, _, _ = data
 
     best = None
     for i in count(1):
-        print(f"ATTEMPT {i} {f"(with constraint < {best:,d})" if best else ''}")
+        constraint = f"(with constraint < {best:,d})" if best else ""
+        print(f"ATTEMPT {i} {constraint}")
 
         # take multiple rounds to find the smallest solution, where,
         # in each round, we punish solutions that are larger than the previous one
@@ -118,7 +120,7 @@ def genetic_solver(fitness, initial_population, verbose=False):
     g = 0
     while best_score < fitness.optimal_score and g < MAX_GENERATIONS:
         if verbose and g % (MAX_GENERATIONS / 100) == 0:
-            print(f"\r{g:6d}: {"":7s}{population[0]:40,d}", end="\r")
+            print(f"\r{g:6d}: {'':7s}{population[0]:40,d}", end="\r")
 
         # evaluate fitness and update best solution
         scores = [fitness(a) for a in population]
@@ -201,20 +203,19 @@ def make_fitness_function(program: list[int], threshold: int | None = None) -> c
 
 
 def load(data):
-    reg, prog = data.split("\n\n")
-    a, b, c = [parse("Register {}: {:d}", line)[1] for line in reg.splitlines()]
-    program = list(map(int, parse("Program: {}", prog)[0].split(",")))
+    # the registers a, b and c, followed by the program
+    a, b, c, *program = map(int, NUMBER.findall(data))
 
     return program, a, b, c
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=17)
+    from store import check_answer, read_input
+
+    data = read_input(17)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == "7,3,5,7,5,7,4,3,0"
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(17, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 105734774294938
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(17, 2, ans2)
@@ -1,97 +1,87 @@
 # Advent of Code 2024, Day 18
 # (c) blu3r4y
 
-from queue import PriorityQueue
+from grid import SENTINEL, coords, directions, index, new_grid
+from search import astar
+from tracing import trace
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
-from tqdm.auto import tqdm
+WALL = ord("#")
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(data, length=1024):
-    coords, bounds = data
+    grid, corrupted = data
 
-    walls = set(coords[:length])
-    return astar_search(walls, 0, bounds, bounds)
+    cells = bytearray(grid.cells)
+    for pos in corrupted[:length]:
+        cells[pos] = WALL
 
+    return astar_search(grid, cells, *endpoints(grid))
 
-@print_calls
-@print_durations(unit="ms")
+
+@trace
 def part2(data):
-    coords, bounds = data
+    from tqdm.auto import tqdm
+
+    grid, corrupted = data
+    start, goal = endpoints(grid)
 
-    walls = set()
-    for xy in tqdm(coords):
-        if xy in walls:
+    cells = bytearray(grid.cells)
+    for pos in tqdm(corrupted):
+        if cells[pos] == WALL:
             continue
-        walls.add(xy)
+        cells[pos] = WALL
 
         # check at what point the goal is not reachable anymore
-        path = astar_search(walls, 0, bounds, bounds)
-        if not path:
-            return f"{int(xy.real)},{int(xy.imag)}"
-
-
-def astar_search(walls, start, goal, bounds):
-    closed = {start: 0}
-    openpq = PriorityQueue()
+        steps = astar_search(grid, cells, start, goal)
+        if steps is None:
+            x, y = coords(grid, pos)
+            return f"{x},{y}"
 
-    tiebreaker = 0
-    openpq.put((0, tiebreaker, start))
-    tiebreaker += 1
 
-    while not openpq.empty():
-        total_steps, _, current = openpq.get()
-        if current == goal:
-            return total_steps
+def astar_search(grid, cells, start, goal):
+    offsets = directions(grid)
+    gx, gy = coords(grid, goal)
 
-        for succ in successor_states(current, walls, bounds):
-            new_steps = closed[current] + 1
-            if succ not in closed or new_steps < closed[succ]:
-                closed[succ] = new_steps
-                estimate = new_steps + manhattan_distance(succ, goal)
-                openpq.put((estimate, tiebreaker, succ))
-                tiebreaker += 1
+    def neighbors(pos):
+        for succ in (pos + off for off in offsets):
+            if cells[succ] not in (WALL, SENTINEL):
+                yield succ, 1
 
+    def manhattan_distance(pos):
+        x, y = coords(grid, pos)
+        return abs(gy - y) + abs(gx - x)
 
-def successor_states(pos, walls, bounds):
-    for nxt in (pos + step for step in (1, 1j, -1, -1j)):
-        if within_bounds(nxt, bounds) and nxt not in walls:
-            yield nxt
+    return astar(start, goal, neighbors, manhattan_distance)
 
 
-def within_bounds(pos, bounds):
-    return 0 <= pos.real <= bounds.real and 0 <= pos.imag <= bounds.imag
-
-
-def manhattan_distance(a, b) -> int:
-    return int(abs(a.imag - b.imag) + abs(a.real - b.real))
+def endpoints(grid):
+    return index(grid, 0, 0), index(grid, grid.width - 1, grid.height - 1)
 
 
 def load(data):
-    coords, width, height = [], 0, 0
+    positions, width, height = [], 0, 0
 
     for line in data.split("\n"):
         x, y = map(int, line.split(","))
-        coords.append(complex(x, y))
+        positions.append((x, y))
         if x > width:
             width = x
         if y > height:
             height = y
 
-    bounds = complex(width, height)
-    return coords, bounds
+    grid = new_grid(width + 1, height + 1)
+    corrupted = [index(grid, x, y) for x, y in positions]
+    return grid, corrupted
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=18)
+    from store import check_answer, read_input
+
+    data = read_input(18)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 326
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(18, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == "18,62"
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(18, 2, ans2)
@@ -1,26 +1,26 @@
 # Advent of Code 2024, Day 19
 # (c) blu3r4y
 
-from functools import cache
+from memo import memo
+from parallel import map_chunks
+from tracing import trace
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
 
-
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(data):
     patterns, designs = data
 
     # can each design be made from the patterns?
-    matcher = make_matcher(patterns)
-    count = sum(1 for design in designs if matcher(design))
+    return sum(map_chunks(count_possible, designs, patterns))
 
-    return count
+
+def count_possible(designs, patterns):
+    matcher = make_matcher(patterns)
+    return sum(1 for design in designs if matcher(design))
 
 
 def make_matcher(patterns):
-    @cache
+    @memo(maxsize=2**12)
     def matcher(design):
         if not design:
             return True
@@ -33,20 +33,21 @@ def make_matcher(patterns):
     return matcher
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data):
     patterns, designs = data
 
     # how many options are there to make each design?
-    counter = make_counter(patterns)
-    count = sum(map(counter, designs))
+    return sum(map_chunks(count_options, designs, patterns))
+
 
-    return count
+def count_options(designs, patterns):
+    counter = make_counter(patterns)
+    return sum(map(counter, designs))
 
 
 def make_counter(patterns):
-    @cache
+    @memo(maxsize=2**12)
     def counter(design):
         if not design:
             return 1
@@ -68,12 +69,12 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=19)
+    from store import check_answer, read_input
+
+    data = read_input(19)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 300
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(19, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 624802218898092
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(19, 2, ans2)
@@ -1,30 +1,25 @@
 # Advent of Code 2024, Day 2
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from parallel import map_chunks
+from tracing import trace
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(data):
-    safe = 0
+    return sum(map_chunks(count_safe, data))
 
-    for vals in data:
-        if is_save(vals):
-            safe += 1
 
-    return safe
+@trace
+def part2(data):
+    return sum(map_chunks(count_safe, data, True))
 
 
-@print_calls
-@print_durations(unit="ms")
-def part2(data):
+def count_safe(reports, dampen=False):
     safe = 0
 
-    for vals in data:
-        dampened = (drop_level(vals, i) for i in range(len(vals)))
-        if is_save(vals) or any(is_save(d) for d in dampened):
+    for vals in reports:
+        if is_save(vals) or (dampen and is_save_dampened(vals)):
             safe += 1
 
     return safe
@@ -37,8 +32,62 @@ def is_save(vals):
     return inc or dec
 
 
-def drop_level(vals, i):
-    return vals[:i] + vals[i + 1 :]
+def is_save_dampened(vals):
+    # in either direction, the first unsafe step stays in the report
+    # unless one of its two levels is removed, so only those two are tried
+    for sign in (1, -1):
+        i = first_unsafe(vals, sign)
+        if i is None or any(first_unsafe(vals, sign, j) is None for j in (i, i + 1)):
+            return True
+
+    return False
+
+
+def first_unsafe(vals, sign, skip=None):
+    # the index of the level before the first unsafe step, if any
+    prev = None
+    for i, val in enumerate(vals):
+        if i == skip:
+            continue
+        if prev is not None and not 1 <= sign * (val - vals[prev]) <= 3:
+            return prev
+        prev = i
+
+    return None
+
+
+@trace
+def part1_batched(data):
+    import numpy as np
+
+    levels, lengths = data
+    return int(np.count_nonzero(is_save_batched(levels, lengths)))
+
+
+@trace
+def part2_batched(data):
+    import numpy as np
+
+    levels, lengths = data
+    safe = is_save_batched(levels, lengths)
+
+    for i in range(levels.shape[1]):
+        # all reports without their i-th level, if they are long enough
+        dropped = np.delete(levels, i, axis=1)
+        safe |= (i < lengths) & is_save_batched(dropped, lengths - 1)
+
+    return int(np.count_nonzero(safe))
+
+
+def is_save_batched(levels, lengths):
+    import numpy as np
+
+    # the steps beyond the end of each report are considered safe
+    diffs = np.diff(levels, axis=1)
+    padding = np.arange(diffs.shape[1]) >= (lengths - 1)[:, None]
+    inc = ((diffs >= 1) & (diffs <= 3)) | padding
+    dec = ((diffs <= -1) & (diffs >= -3)) | padding
+    return inc.all(axis=1) | dec.all(axis=1)
 
 
 def load(data):
@@ -49,13 +98,31 @@ def load(data):
     return pairs
 
 
+def load_batched(data):
+    import numpy as np
+
+    # all reports in one array, padded to the length of the longest one
+    text = np.frombuffer(data.encode(), dtype=np.uint8)
+    digits = (text >= ord("0")) & (text <= ord("9"))
+    starts = digits & ~np.r_[False, digits[:-1]]
+    lines = np.cumsum(text == ord("\n"))[starts]
+    lengths = np.bincount(lines)
+    lengths = lengths[lengths > 0]  # no reports for empty lines
+
+    levels = np.zeros((len(lengths), lengths.max(initial=0)), dtype=np.int64)
+    levels[np.arange(levels.shape[1]) < lengths[:, None]] = np.fromstring(
+        data, dtype=np.int64, sep=" "
+    )
+    return levels, lengths
+
+
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=2)
+    from store import check_answer, read_input
+
+    data = read_input(2)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 516
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(2, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 561
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(2, 2, ans2)
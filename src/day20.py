@@ -1,113 +1,82 @@
 # Advent of Code 2024, Day 20
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+import numpy as np
+
+from grid import directions, find, parse_grid
+from search import bfs
+from tracing import trace
 
 START, END, WALL, EMPTY = "S", "E", "#", "."
-UP, DOWN, RIGHT, LEFT = -1j, 1j, 1, -1
+
+# the longest cheat, which is also the border around the grid,
+# so that all cheat positions are within the cells array
+MAX_SKIP = 20
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(data):
-    walls, start, end = data
-    return solve(walls, start, end, 2)
+    grid, start, end = data
+    return solve(grid, start, end, 2)
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data):
-    walls, start, end = data
-    return solve(walls, start, end, 20)
+    grid, start, end = data
+    return solve(grid, start, end, 20)
 
 
-def solve(walls, start, end, max_skip=2, min_gain=100):
-    track = build_track(start, end, walls)
-
-    # lookup table to get index within the track
-    track_positions = {pos: i for i, pos in enumerate(track)}
+def solve(grid, start, end, max_skip=2, min_gain=100):
+    # the track is a single path, so the distance from the start is also
+    # the index within the track, or -1 if not on the track
+    track_positions = np.array(distance_field(grid, start))
+    track = np.flatnonzero(track_positions >= 0)
+    assert track_positions[end] >= 0, "the end must be on the track"
 
     count_cheats = 0
-    for i, pos in enumerate(track):
-        targets = cheat_positions(pos, walls, max_skip)
-        for target in targets:
-            if target not in track_positions:
-                continue
-
-            # calculate the saved distance if we would cheat
-            j = track_positions[target]
-            gain = j - i - distance(pos, target)
-            if gain >= min_gain:
-                count_cheats += 1
-
-    return count_cheats
-
-
-def build_track(start, end, walls):
-    track = [start]
+    for offset, dist in cheat_offsets(grid, max_skip):
+        # calculate the saved distance for all cheats with this offset at once
+        j = track_positions[track + offset]
+        gain = j - track_positions[track] - dist
+        count_cheats += np.count_nonzero((j >= 0) & (gain >= min_gain))
 
-    while track[-1] != end:
-        for move in (UP, DOWN, LEFT, RIGHT):
-            pos = track[-1] + move
+    return int(count_cheats)
 
-            # don't hit walls or go back
-            if pos in walls:
-                continue
-            if len(track) > 1 and track[-2] == pos:
-                continue
 
-            track.append(pos)
-            break
+def distance_field(grid, start):
+    cells, offsets = grid.cells.tolist(), directions(grid)
 
-    return track
+    def neighbors(pos):
+        # don't hit walls, the border is outside the track as well
+        for succ in (pos + off for off in offsets):
+            if cells[succ] in (ord(START), ord(END), ord(EMPTY)):
+                yield succ
 
+    return bfs([start], neighbors, len(cells))
 
-def cheat_positions(pos, walls, size=2):
-    targets = set()
 
-    # get all positions that are reachable from the given position, i.e.,
-    # all positions that have a manhattan distance smaller or equal to the given size
-    for dx in range(size + 1):
-        targets.update(pos + LEFT * dx + UP * dy for dy in range(size + 1 - dx))
-        targets.update(pos + LEFT * dx + DOWN * dy for dy in range(size + 1 - dx))
-        targets.update(pos + RIGHT * dx + UP * dy for dy in range(size + 1 - dx))
-        targets.update(pos + RIGHT * dx + DOWN * dy for dy in range(size + 1 - dx))
-
-    targets -= walls
-    return targets
-
-
-def distance(a, b):
-    return abs(a.real - b.real) + abs(a.imag - b.imag)
+def cheat_offsets(grid, size=2):
+    # all offsets that have a manhattan distance smaller or equal to the given
+    # size, together with that distance
+    for dx in range(-size, size + 1):
+        for dy in range(abs(dx) - size, size - abs(dx) + 1):
+            if dx or dy:
+                yield dy * grid.stride + dx, abs(dx) + abs(dy)
 
 
 def load(data):
-    gridlines = data.splitlines()
-
-    walls, start, end = set(), None, None
-    for r, row in enumerate(gridlines):
-        for c, cell in enumerate(row):
-            pos = complex(c, r)
-            if cell == EMPTY:
-                continue
-            elif cell == START:
-                start = pos
-            elif cell == END:
-                end = pos
-            elif cell == WALL:
-                walls.add(pos)
-
-    return walls, start, end
+    grid = parse_grid(data, pad=MAX_SKIP)
+    start, end = int(find(grid, START)[0]), int(find(grid, END)[0])
+    return grid, start, end
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=20)
+    from store import check_answer, read_input
+
+    data = read_input(20)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 1289
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(20, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 982425
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(20, 2, ans2)
@@ -1,16 +1,20 @@
 # Advent of Code 2024, Day 21
 # (c) blu3r4y
 
-from functools import cache
+from typing import TYPE_CHECKING
 
-import networkx as nx
-from aocd.models import Puzzle
-from funcy import pairwise, print_calls, print_durations
+from funcy import pairwise
+
+from memo import memo
+from tracing import trace
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 UP, DOWN, LEFT, RIGHT, ACTION = "^", "v", "<", ">", "A"
 
-ROBO_KEYPAD: nx.Graph = None
-DOOR_KEYPAD: nx.Graph = None
+ROBO_KEYPAD: "nx.Graph" = None
+DOOR_KEYPAD: "nx.Graph" = None
 
 ROBO_SHORTEST_PATHS: dict[dict[any, any]] = None
 DOOR_SHORTEST_PATHS: dict[dict[any, any]] = None
@@ -19,14 +23,12 @@ ROBO_DISTANCES: dict[dict[any, int]] = None
 DOOR_DISTANCES: dict[dict[any, int]] = None
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(codes):
     return solve(codes, 2)
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(codes):
     return solve(codes, 25)
 
@@ -41,7 +43,7 @@ def solve(codes, max_depth):
     return compute_complexity(codes, lengths)
 
 
-@cache
+@memo(maxsize=2**10)
 def dfs(sequences, depth=1):
     length = 0
     for seq in sequences:
@@ -59,7 +61,7 @@ def indirect_door_keypad(buttons):
     return tuple(seqs)
 
 
-@cache
+@memo(maxsize=2**6)
 def indirect_robo_keypad(buttons):
     # return the shortest indirect sequences on the directional (roboter) keypad
     seqs = all_indirect_sequences(ROBO_KEYPAD, ROBO_SHORTEST_PATHS, buttons)
@@ -68,6 +70,8 @@ def indirect_robo_keypad(buttons):
 
 
 def all_indirect_sequences(G, shortest_paths, buttons):
+    import networkx as nx
+
     sequences = []
 
     # sequentially indirect each button press
@@ -126,6 +130,8 @@ def compute_complexity(codes, lengths):
 
 
 def make_numeric_keypad():
+    import networkx as nx
+
     # +---+---+---+
     # | 7 | 8 | 9 |
     # +---+---+---+
@@ -183,6 +189,8 @@ def make_numeric_keypad():
 
 
 def make_directional_keypad():
+    import networkx as nx
+
     #     +---+---+
     #     | ^ | A |
     # +---+---+---+
@@ -210,6 +218,8 @@ def make_directional_keypad():
 
 
 def init():
+    import networkx as nx
+
     global DOOR_KEYPAD, ROBO_KEYPAD
     DOOR_KEYPAD = make_numeric_keypad()
     ROBO_KEYPAD = make_directional_keypad()
@@ -231,14 +241,14 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=21)
+    from store import check_answer, read_input
+
+    data = read_input(21)
 
     init()
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 212488
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(21, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 258263972600402
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(21, 2, ans2)
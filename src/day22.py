@@ -2,18 +2,22 @@
 # (c) blu3r4y
 
 from collections import defaultdict
-from functools import cache
 
-from aocd.models import Puzzle
-from funcy import collecting, partition, print_calls, print_durations
+from funcy import collecting, partition
+
+from parallel import map_chunks
+from tracing import trace
 
 NUM_SECRETS = 2000
 MASK = (1 << 24) - 1
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(seeds):
+    return sum(map_chunks(sum_last_secrets, seeds))
+
+
+def sum_last_secrets(seeds):
     result = 0
     for s in seeds:
         result += secret_sequence(s, NUM_SECRETS)[-1]
@@ -21,9 +25,17 @@ def part1(seeds):
     return result
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(seeds):
+    counts = defaultdict(int)
+    for chunk in map_chunks(banana_counts, seeds):
+        for quad, count in chunk.items():
+            counts[quad] += count
+
+    return max(counts.values())
+
+
+def banana_counts(seeds):
     counts = defaultdict(int)
     for s in seeds:
         # [3, 0, 6, 5, 4, 4, ...]
@@ -33,7 +45,7 @@ def part2(seeds):
         # {(-3, 6, -1, -1): +1, (6, -1, -1, 0): +2, ...}
         add_banana_counts(deltas, digits, counts)
 
-    return max(counts.values())
+    return counts
 
 
 def add_banana_counts(deltas, digits, counts):
@@ -60,7 +72,6 @@ def one_digits(s, n=1):
     return [s % 10 for s in secret_sequence(s, n)]
 
 
-@cache
 @collecting
 def secret_sequence(s, n=1):
     yield s
@@ -69,7 +80,6 @@ def secret_sequence(s, n=1):
         yield s
 
 
-@cache
 def advance(s):
     s = ((s << 6) ^ s) & MASK  #  ((s * 64) XOR s) mod 2^24
     s = ((s >> 5) ^ s) & MASK  #  ((s // 32) XOR s) mod 2^24
@@ -82,12 +92,12 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=22)
+    from store import check_answer, read_input
+
+    data = read_input(22)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 17724064040
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(22, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 1998
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(22, 2, ans2)
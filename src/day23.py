@@ -1,14 +1,15 @@
 # Advent of Code 2024, Day 23
 # (c) blu3r4y
 
-import networkx as nx
-from aocd.models import Puzzle
-from funcy import last, print_calls, print_durations
+from funcy import last
 
+from tracing import trace
 
-@print_calls
-@print_durations(unit="ms")
+
+@trace
 def part1(G):
+    import networkx as nx
+
     count = 0
 
     # cliques are subgraphs with all nodes connected to each other
@@ -26,15 +27,18 @@ def part1(G):
     return count
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(G):
+    import networkx as nx
+
     # the largest clique is the last one in the enumeration
     clique = last(nx.enumerate_all_cliques(G))
     return ",".join(sorted(clique))
 
 
 def load(data):
+    import networkx as nx
+
     G = nx.Graph()
     for lines in data.splitlines():
         a, b = lines.split("-")
@@ -43,12 +47,12 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=23)
+    from store import check_answer, read_input
+
+    data = read_input(23)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 1308
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(23, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == "bu,fq,fz,pn,rr,st,sv,tr,un,uy,zf,zi,zy"
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(23, 2, ans2)
@@ -1,17 +1,18 @@
 # Advent of Code 2024, Day 24
 # (c) blu3r4y
 
+import re
 from collections import namedtuple
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
-from parse import parse
+from tracing import trace
 
 Gate = namedtuple("Gate", "op x y out")
 
+WIRE = re.compile(r"(\w+): (\d)")
+GATE = re.compile(r"(\w+) (\w+) (\w+) -> (\w+)")
 
-@print_calls
-@print_durations(unit="ms")
+
+@trace
 def part1(data):
     wires, gates = data
 
@@ -24,8 +25,7 @@ def part1(data):
     return int(binary, 2)
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data):
     wires, gates = data
 
@@ -34,10 +34,10 @@ def part2(data):
     *znames, _ = gate_names(gates, "z")  # ignore last output (carry)
     assert len(xnames) == len(ynames) == len(znames)
 
-    # check full adder structure
+    # check full adder structure, the lowest bit has no carry input
     errors = set()
     for x, y, z in zip(xnames, ynames, znames):
-        errs = check_full_adder(x, y, z, gates, ignore_carry=(x == "x00"))
+        errs = check_full_adder(x, y, z, gates, ignore_carry=(x == xnames[0]))
         errors.update(errs)
 
     return ",".join(sorted(errors))
@@ -129,25 +129,23 @@ def load(data):
     a, b = data.split("\n\n")
 
     wires = dict()
-    for line in a.splitlines():
-        w, val = line.split(":")
-        wires[w] = int(val.strip())
+    for w, val in WIRE.findall(a):
+        wires[w] = int(val)
 
     gates = dict()
-    for line in b.splitlines():
-        x, op, y, out = parse("{:w} {:w} {:w} -> {:w}", line)
+    for x, op, y, out in GATE.findall(b):
         gates[out] = Gate(op, x, y, out)
 
     return wires, gates
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=24)
+    from store import check_answer, read_input
+
+    data = read_input(24)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 55920211035878
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(24, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == "btb,cmv,mwp,rdg,rmj,z17,z23,z30"
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(24, 2, ans2)
@@ -1,16 +1,14 @@
 # Advent of Code 2024, Day 25
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from tracing import trace
 
 FILLED, EMPTY = "#", "."
 WIDTH, HEIGHT = 5, 7
 SLOT = 5
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(schematics):
     locks, keys = [], []
     for schematic in schematics:
@@ -62,8 +60,9 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=25)
+    from store import check_answer, read_input
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 3508
-    puzzle.answer_a = ans1
+    data = read_input(25)
+
+    ans1 = part1(load(data))
+    check_answer(25, 1, ans1)
@@ -1,62 +1,126 @@
 # Advent of Code 2024, Day 3
 # (c) blu3r4y
 
+import mmap
+import os
 import re
+from collections import namedtuple
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from parallel import map_chunks
+from tracing import trace
 
+# a multiplication with its operands, or a switch to enable or disable them
+INSTRUCTION = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|(do|don't)\(\)")
+INSTRUCTION_BYTES = re.compile(INSTRUCTION.pattern.encode())
 
-@print_calls
-@print_durations(unit="ms")
-def part1(data):
-    muls, _, _ = data
-    return sum(a * b for a, b in muls.values())
+# bytes per chunk when scanning memory dumps that don't fit into memory, and how
+# far to look beyond the end of a chunk, for instructions that start right before
+CHUNK_BYTES = 1 << 24
+OVERLAP = len("mul(123,456)") - 1
 
+# the sums of a chunk if it is entered enabled or disabled, the sum of all
+# multiplications, and whether it ends enabled, or none if it has no switch
+Summary = namedtuple("Summary", ["enabled", "disabled", "total", "switch"])
 
-@print_calls
-@print_durations(unit="ms")
-def part2(data):
-    muls, dos, donts = data
-    limit = max(muls.keys() | dos | donts)
 
-    result, disabled = 0, False
+@trace
+def part1(instructions):
+    return sum(product for product, _ in instructions)
 
-    for i in range(limit + 1):
-        if i in muls:
-            if not disabled:
-                a, b = muls[i]
-                result += a * b
-        elif i in dos:
-            disabled = False
-        elif i in donts:
-            disabled = True
+
+@trace
+def part2(instructions):
+    result, enabled = 0, True
+
+    for product, switch in instructions:
+        if switch:
+            enabled = switch == "do"
+        elif enabled:
+            result += product
 
     return result
 
 
-def load(data):
-    muls, dos, donts = dict(), set(), set()
+@trace
+def part1_streaming(path, chunk_bytes=CHUNK_BYTES):
+    return sum(s.total for s in scan(path, chunk_bytes))
+
+
+@trace
+def part2_streaming(path, chunk_bytes=CHUNK_BYTES):
+    # the switches compose, so the chunks are combined from left to right
+    result, enabled = 0, True
+    for s in scan(path, chunk_bytes):
+        result += s.enabled if enabled else s.disabled
+        enabled = enabled if s.switch is None else s.switch
+
+    return result
+
+
+def scan(path, chunk_bytes=CHUNK_BYTES):
+    # the summaries of all chunks in order, scanned on a pool of workers
+    size = os.path.getsize(path)
+    ranges = [(i, min(i + chunk_bytes, size)) for i in range(0, size, chunk_bytes)]
+    summaries = map_chunks(scan_chunks, ranges, path, mode="on")
+    return [s for chunk in summaries for s in chunk]
+
 
-    for match in re.compile(r"mul\((\d{1,3}),(\d{1,3})\)").finditer(data):
-        muls[match.start(0)] = tuple(map(int, match.groups()))
+def scan_chunks(ranges, path):
+    # instructions can't overlap each other, so each instruction is found
+    # in the chunk where it starts, even if it ends in the next one
+    summaries = []
+    if os.path.getsize(path) == 0:
+        return summaries  # empty files can't be mapped
 
-    for match in re.compile(r"do\(\)").finditer(data):
-        dos.add(match.start(0))
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start, end in ranges:
+            enabled = disabled = total = 0
+            switch = None
 
-    for match in re.compile(r"don't\(\)").finditer(data):
-        donts.add(match.start(0))
+            for match in INSTRUCTION_BYTES.finditer(mm, start, end + OVERLAP):
+                if match.start() >= end:
+                    break
 
-    return muls, dos, donts
+                a, b, name = match.groups()
+                if name:
+                    switch = name == b"do"
+                    continue
+
+                product = int(a) * int(b)
+                total += product
+                if switch is None:
+                    enabled += product  # only if the chunk is entered enabled
+                elif switch:
+                    enabled += product
+                    disabled += product
+
+            summaries.append(Summary(enabled, disabled, total, switch))
+
+    return summaries
+
+
+def load(data):
+    # all instructions in order, as (product, switch) pairs
+    return [
+        (int(a) * int(b) if a else 0, switch)
+        for a, b, switch in INSTRUCTION.findall(data)
+    ]
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=3)
+    import sys
+
+    from store import check_answer, read_input
+
+    if len(sys.argv) > 1:
+        # scan a memory dump that may be larger than memory
+        print(part1_streaming(sys.argv[1]), part2_streaming(sys.argv[1]))
+        sys.exit()
+
+    data = read_input(3)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 190604937
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(3, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 82857512
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(3, 2, ans2)
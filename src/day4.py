@@ -2,95 +2,66 @@
 # (c) blu3r4y
 
 import numpy as np
-from aocd.models import Puzzle
-from funcy import lmap, print_calls, print_durations
 
-MAIN_DIAGONAL = ((-1, -1), (0, 0), (1, 1))
-ANTI_DIAGONAL = ((-1, 1), (0, 0), (1, -1))
+from grid import parse_grid
+from tracing import trace
 
+WORD = b"XMAS"
+M, A, S = b"MAS"
 
-@print_calls
-@print_durations(unit="ms")
-def part1(data):
-    counts = 0
-    for yield_fn in YIELD_FUNCTIONS:
-        for line in yield_fn(data):
-            counts += line.count("XMAS")
-            counts += line.count("SAMX")
-
-    return counts
-
+# a border as wide as the word is long after its first letter,
+# so that the word can be looked up in any direction from any cell
+PAD = len(WORD) - 1
 
-@print_calls
-@print_durations(unit="ms")
-def part2(data):
-    grid_size = len(data)
 
+@trace
+def part1(grid):
+    s = grid.stride
     counts = 0
-    for x in range(grid_size):
-        for y in range(grid_size):
-            if is_xmas(data, x, y, grid_size):
-                counts += 1
-
-    return counts
-
 
-def is_xmas(data, x, y, grid_size):
-    left_text = text_at(data, x, y, grid_size, MAIN_DIAGONAL)
-    right_text = text_at(data, x, y, grid_size, ANTI_DIAGONAL)
-    return left_text in ("MAS", "SAM") and right_text in ("MAS", "SAM")
+    for offset in (-s - 1, -s, -s + 1, -1, 1, s - 1, s, s + 1):
+        # cells where each letter is at its distance in this direction
+        found = shifted(grid, 0) == WORD[0]
+        for i, char in enumerate(WORD[1:], start=1):
+            found &= shifted(grid, i * offset) == char
+        counts += np.count_nonzero(found)
 
+    return int(counts)
 
-def text_at(grid, x, y, grid_size, offsets):
-    indexes = [(x + dx, y + dy) for dx, dy in offsets]
-    if all(0 <= x < grid_size and 0 <= y < grid_size for x, y in indexes):
-        return "".join(grid[x][y] for x, y in indexes)
 
+@trace
+def part2(grid):
+    s = grid.stride
 
-def yield_horizontal(data):
-    for row in data:
-        yield row
+    # the letters at the ends of both diagonals through each cell
+    main = shifted(grid, -s - 1), shifted(grid, s + 1)
+    anti = shifted(grid, -s + 1), shifted(grid, s - 1)
 
+    found = shifted(grid, 0) == A
+    for first, last in (main, anti):
+        found &= ((first == M) & (last == S)) | ((first == S) & (last == M))
 
-def yield_vertical(data):
-    grid_size = len(data)
-    for col in range(grid_size):
-        yield "".join(row[col] for row in data)
+    return int(np.count_nonzero(found))
 
 
-def yield_main_diagonal(data):
-    grid_size = len(data)
-    data = np.array(lmap(list, data))
-    for i in range(-grid_size + 1, grid_size):
-        yield "".join(data.diagonal(i))
-
-
-def yield_anti_diagonal(data):
-    grid_size = len(data)
-    data = np.array(lmap(list, data))
-    for i in range(-grid_size + 1, grid_size):
-        yield "".join(np.fliplr(data).diagonal(i))
-
-
-YIELD_FUNCTIONS = [
-    yield_horizontal,
-    yield_vertical,
-    yield_main_diagonal,
-    yield_anti_diagonal,
-]
+def shifted(grid, offset):
+    # the cells at the offset from each cell, skipping the outer border,
+    # where the offsets would go beyond the array
+    margin = PAD * (grid.stride + 1)
+    return grid.cells[margin + offset : len(grid.cells) - margin + offset]
 
 
 def load(data):
-    return data.splitlines()
+    return parse_grid(data, pad=PAD)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=4)
+    from store import check_answer, read_input
+
+    data = read_input(4)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 2434
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(4, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 1835
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(4, 2, ans2)
@@ -1,12 +1,10 @@
 # Advent of Code 2024, Day 5
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from tracing import trace
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(data):
     rules, books = data
 
@@ -18,8 +16,7 @@ def part1(data):
     return result
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data):
     rules, books = data
 
@@ -76,12 +73,12 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=5)
+    from store import check_answer, read_input
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 6384
-    puzzle.answer_a = ans1
+    data = read_input(5)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 5353
-    puzzle.answer_b = ans2
+    ans1 = part1(load(data))
+    check_answer(5, 1, ans1)
+
+    ans2 = part2(load(data))
+    check_answer(5, 2, ans2)
@@ -1,118 +1,87 @@
 # Advent of Code 2024, Day 6
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
-from tqdm.auto import tqdm
+from grid import SENTINEL, directions, find, parse_grid
+from parallel import map_chunks
+from tracing import trace
 
-GUARD = "^"
-WALL = "#"
+GUARD, WALL, EMPTY = "^", ord("#"), ord(".")
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(data):
-    walls, guard, limits = data
+    grid, guard = data
+    cells, offsets = bytearray(grid.cells), directions(grid)
 
     visited = set()
-    heading = -1j
+    heading = 0  # up
 
-    while within_bounds(guard, limits):
+    while cells[guard] != SENTINEL:
         visited.add(guard)
-        while guard + heading in walls:
-            heading *= 1j  # turn right
-        guard += heading
+        while cells[guard + offsets[heading]] == WALL:
+            heading = (heading + 1) % 4  # turn right
+        guard += offsets[heading]
 
     return len(visited)
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data):
-    walls, guard, limits = data
-    width, height = limits
+    grid, guard = data
+    candidates = find(grid, chr(EMPTY)).tolist()
+    return sum(map_chunks(count_loops, candidates, grid, guard))
 
-    obstructions = 0
 
-    pbar = tqdm(total=width * height - len(walls) - 1)
-    for r in range(width):
-        for c in range(height):
-            cell = complex(c, r)
-            if cell == guard or cell in walls:
-                continue
+def count_loops(candidates, grid, guard):
+    from tqdm.auto import tqdm
+
+    # each chunk places its obstructions on its own copy of the cells
+    cells, offsets = bytearray(grid.cells), directions(grid)
 
-            if is_guard_looping(walls | {cell}, guard, limits):
-                obstructions += 1
+    obstructions = 0
 
-            pbar.update(1)
+    for cell in tqdm(candidates):
+        cells[cell] = WALL
+        if is_guard_looping(cells, guard, offsets):
+            obstructions += 1
+        cells[cell] = EMPTY
 
     return obstructions
 
 
-def within_bounds(pos, limits):
-    height, width = limits
-    return 0 <= pos.imag < height and 0 <= pos.real < width
-
+def is_guard_looping(cells, guard, offsets):
+    turns = set()
+    heading = 0  # up
 
-def is_guard_looping(walls, guard, limits):
-    visited = []
-    heading = -1j
+    while cells[guard] != SENTINEL:
+        if cells[guard + offsets[heading]] != WALL:
+            guard += offsets[heading]
+            continue
 
-    while within_bounds(guard, limits):
-        # cycle-checking is costly, so only do it sometimes
-        if len(visited) % 10_000 == 0:
-            if detect_cycle(visited):
-                return True
+        # hitting the same wall from the same direction again is a cycle
+        if (guard, heading) in turns:
+            return True
 
-        visited.append(guard)
-        while guard + heading in walls:
-            heading *= 1j  # turn right
-        guard += heading
+        turns.add((guard, heading))
+        heading = (heading + 1) % 4  # turn right
 
     # out of bounds, no cycle
     return False
 
 
-def detect_cycle(visited):
-    if len(visited) < 2:
-        return False
-
-    # Floyd's Tortoise and Hare algorithm
-    tortoise, hare = 0, 0
-    while True:
-        if hare + 1 >= len(visited) or hare + 2 >= len(visited):
-            return False
-
-        tortoise += 1
-        hare += 2
-
-        if visited[tortoise] == visited[hare]:
-            return True
-
-
 def load(data):
-    walls, guard = set(), None
-
-    rows = data.splitlines()
-    for r, row in enumerate(data.splitlines()):
-        for c, cell in enumerate(row):
-            pos = complex(c, r)
-            if cell == WALL:
-                walls.add(pos)
-            elif cell == GUARD:
-                guard = pos
-
-    limits = len(rows), len(rows[0])
-    return walls, guard, limits
+    grid = parse_grid(data)
+    guard = int(find(grid, GUARD)[0])
+    return grid, guard
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=6)
+    from store import check_answer, read_input
+
+    data = read_input(6)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 5242
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(6, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 1424
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(6, 2, ans2)
@@ -1,29 +1,33 @@
 # Advent of Code 2024, Day 7
 # (c) blu3r4y
 
+import re
 from itertools import product
 from operator import add, mul
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
-from parse import parse
+from parallel import map_chunks
+from tracing import trace
 
+NUMBER = re.compile(r"\d+")
 
-@print_calls
-@print_durations(unit="ms")
+
+@trace
 def part1(equations):
     operations = [add, mul]
     return solve(equations, operations)
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(equations):
     operations = [add, mul, concat]
     return solve(equations, operations)
 
 
 def solve(equations, operations):
+    return sum(map_chunks(sum_solvable, equations, operations))
+
+
+def sum_solvable(equations, operations):
     total = 0
     for lval, rvals in equations:
         if (res := evaluate(lval, rvals, operations)) is not None:
@@ -53,20 +57,19 @@ def concat(a, b):
 def load(data):
     equations = []
     for line in data.split("\n"):
-        lval, rvals = parse("{:d}: {}", line)
-        rvals = tuple(map(int, rvals.split()))
-        equations.append((lval, rvals))
+        lval, *rvals = map(int, NUMBER.findall(line))
+        equations.append((lval, tuple(rvals)))
 
     return equations
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=7)
+    from store import check_answer, read_input
+
+    data = read_input(7)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 1582598718861
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(7, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 165278151522644
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(7, 2, ans2)
@@ -3,75 +3,72 @@
 
 from itertools import combinations
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+import numpy as np
 
+from grid import SENTINEL, coords, index, parse_grid
+from tracing import trace
 
-@print_calls
-@print_durations(unit="ms")
+
+@trace
 def part1(data):
-    antennas, limits = data
-    return solve(antennas, limits)
+    return solve(data)
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data):
-    antennas, limits = data
-    return solve(antennas, limits, harmonics=True)
-
+    return solve(data, harmonics=True)
 
-def solve(antennas, limits, harmonics=False):
-    antinodes = set()
 
-    for antenna in set(antennas.values()):
-        locs = [pos for pos, a in antennas.items() if a == antenna]
+def solve(grid, harmonics=False):
+    antinodes = np.zeros_like(grid.cells, dtype=bool)
 
+    for locs in find_antennas(grid).values():
         if harmonics:
             # each antenna is an antinode then
-            antinodes.update(locs)
+            antinodes[[index(grid, x, y) for x, y in locs]] = True
 
-        for a, b in combinations(locs, 2):
-            dist = b - a
+        for (ax, ay), (bx, by) in combinations(locs, 2):
+            dx, dy = bx - ax, by - ay
 
-            while within_bounds(a := a - dist, limits):
-                antinodes.add(a)
+            while within_bounds(ax := ax - dx, ay := ay - dy, grid):
+                antinodes[index(grid, ax, ay)] = True
                 if not harmonics:
                     break  # once per pair
 
-            while within_bounds(b := b + dist, limits):
-                antinodes.add(b)
+            while within_bounds(bx := bx + dx, by := by + dy, grid):
+                antinodes[index(grid, bx, by)] = True
                 if not harmonics:
                     break  # once per pair
 
-    return len(antinodes)
+    return int(antinodes.sum())
 
 
-def within_bounds(pos, limits):
-    return 0 <= pos.real < limits[1] and 0 <= pos.imag < limits[0]
+def find_antennas(grid):
+    antennas = dict()
 
+    cells = grid.cells
+    for i in np.flatnonzero((cells != ord(".")) & (cells != SENTINEL)).tolist():
+        antennas.setdefault(cells[i], []).append(coords(grid, i))
 
-def load(data):
-    antennas = dict()
+    return antennas
 
-    rows = data.splitlines()
-    for r, row in enumerate(data.splitlines()):
-        for c, cell in enumerate(row):
-            pos = complex(c, r)
-            if cell != ".":
-                antennas[pos] = cell
 
-    limits = len(rows), len(rows[0])
-    return antennas, limits
+def within_bounds(x, y, grid):
+    # antinodes may be far outside, so the border alone doesn't help here
+    return 0 <= x < grid.width and 0 <= y < grid.height
+
+
+def load(data):
+    return parse_grid(data)
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=8)
+    from store import check_answer, read_input
+
+    data = read_input(8)
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 289
-    puzzle.answer_a = ans1
+    ans1 = part1(load(data))
+    check_answer(8, 1, ans1)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 1030
-    puzzle.answer_b = ans2
+    ans2 = part2(load(data))
+    check_answer(8, 2, ans2)
@@ -1,12 +1,10 @@
 # Advent of Code 2024, Day 9
 # (c) blu3r4y
 
-from aocd.models import Puzzle
-from funcy import print_calls, print_durations
+from tracing import trace
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part1(data):
     blocks = make_blocks(data)
     move_blocks(blocks)
@@ -65,8 +63,7 @@ def checksum_blocks(data):
     return result
 
 
-@print_calls
-@print_durations(unit="ms")
+@trace
 def part2(data):
     blocks = make_files(data)
     move_files(blocks)
@@ -130,12 +127,12 @@ def load(data):
 
 
 if __name__ == "__main__":
-    puzzle = Puzzle(year=2024, day=9)
+    from store import check_answer, read_input
 
-    ans1 = part1(load(puzzle.input_data))
-    assert ans1 == 6337367222422
-    puzzle.answer_a = ans1
+    data = read_input(9)
 
-    ans2 = part2(load(puzzle.input_data))
-    assert ans2 == 6361380647183
-    puzzle.answer_b = ans2
+    ans1 = part1(load(data))
+    check_answer(9, 1, ans1)
+
+    ans2 = part2(load(data))
+    check_answer(9, 2, ans2)
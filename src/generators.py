@@ -0,0 +1,498 @@
+# Advent of Code 2024, Input Generators
+# (c) blu3r4y
+
+import math
+import random
+import string
+from collections import deque
+
+# each generator takes a random number generator and a scale, where a scale
+# of one roughly matches the size of a real puzzle input, and larger scales
+# grow the number of lines or, for grids, the number of cells
+
+
+def generate(day, scale=1, seed=0):
+    rng = random.Random(f"{day}-{scale}-{seed}")
+    return GENERATORS[day](rng, scale)
+
+
+def generate_day1(rng, scale):
+    left = [rng.randint(10000, 99999) for _ in range(1000 * scale)]
+    right = [
+        rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999)
+        for _ in left
+    ]
+    return "\n".join(f"{l}   {r}" for l, r in zip(left, right))
+
+
+def generate_day2(rng, scale):
+    lines = []
+    for _ in range(1000 * scale):
+        step = rng.choice([1, -1])
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + step * rng.randint(1, 3))
+        if rng.random() < 0.6:  # make it unsafe, maybe
+            levels[rng.randrange(len(levels))] += rng.randint(-3, 3)
+        lines.append(" ".join(map(str, levels)))
+    return "\n".join(lines)
+
+
+def generate_day3(rng, scale):
+    noise = "mul(,)do'n't[]{}<>!@#$%^&*?:+-_ 0123456789whyselectfromhow"
+    tokens = []
+    for _ in range(700 * scale):
+        choice = rng.random()
+        if choice < 0.05:
+            tokens.append("do()")
+        elif choice < 0.1:
+            tokens.append("don't()")
+        elif choice < 0.15:
+            tokens.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)}]")
+        else:
+            tokens.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        tokens.append("".join(rng.choices(noise, k=rng.randint(0, 20))))
+
+    text = "".join(tokens)
+    return "\n".join(text[i : i + 3000] for i in range(0, len(text), 3000))
+
+
+def generate_day4(rng, scale):
+    side = scaled_side(140, scale)
+    return "\n".join("".join(rng.choices("XMAS", k=side)) for _ in range(side))
+
+
+def generate_day5(rng, scale):
+    # all rules are derived from a total order, so every book can be fixed
+    order = rng.sample(range(10, 100), 49)
+    rules = [f"{a}|{b}" for i, a in enumerate(order) for b in order[i + 1 :]]
+    rng.shuffle(rules)
+
+    books = []
+    for _ in range(200 * scale):
+        pages = rng.sample(order, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            pages.sort(key=order.index)
+        books.append(",".join(map(str, pages)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(books)
+
+
+def generate_day6(rng, scale):
+    side = scaled_side(130, scale)
+
+    # the guard must leave the map in the first part, so try again otherwise
+    while True:
+        grid = [
+            ["#" if rng.random() < 0.05 else "." for _ in range(side)]
+            for _ in range(side)
+        ]
+        grid[side // 2][side // 2] = "^"
+        if guard_leaves(grid, side // 2, side // 2):
+            return format_grid(grid)
+
+
+def generate_day7(rng, scale):
+    # like the real inputs, mostly short equations of small operands, and targets
+    # below 10^15, otherwise the second part is much slower than on real inputs
+    limit = 10**15
+    lines = []
+    for _ in range(850 * scale):
+        count = rng.randint(2, rng.randint(4, 12))
+        rvals = [rng.randint(1, 9 if rng.random() < 0.6 else 999) for _ in range(count)]
+        lval = rng.randint(1, 10**12)
+        if rng.random() < 0.5:  # solvable, by construction
+            lval = rvals[0]
+            for i, r in enumerate(rvals[1:], start=1):
+                results = [lval + r, lval * r, int(f"{lval}{r}")]
+                results = [v for v in results if v < limit]
+                if not results:
+                    rvals = rvals[:i]  # stop before the target gets too large
+                    break
+                lval = rng.choice(results)
+        lines.append(f"{lval}: {' '.join(map(str, rvals))}")
+    return "\n".join(lines)
+
+
+def generate_day8(rng, scale):
+    side = scaled_side(50, scale)
+    freqs = string.digits + string.ascii_letters
+    grid = [["." for _ in range(side)] for _ in range(side)]
+    for _ in range(200 * scale):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(freqs)
+    return format_grid(grid)
+
+
+def generate_day9(rng, scale):
+    digits = []
+    for i in range(19999 * scale):
+        digits.append(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9))
+    return "".join(map(str, digits))
+
+
+def generate_day10(rng, scale):
+    side = scaled_side(55, scale)
+    grid = [[rng.randint(0, 9) for _ in range(side)] for _ in range(side)]
+
+    # carve some uphill trails, so that there is something to find
+    for _ in range(side * side // 30):
+        r, c = rng.randrange(side), rng.randrange(side)
+        for height in range(10):
+            grid[r][c] = height
+            dr, dc = rng.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
+            r, c = min(max(r + dr, 0), side - 1), min(max(c + dc, 0), side - 1)
+
+    return format_grid(grid)
+
+
+def generate_day11(rng, scale):
+    return " ".join(str(rng.randint(0, 9_999_999)) for _ in range(8 * scale))
+
+
+def generate_day12(rng, scale):
+    side = scaled_side(140, scale)
+
+    # plant regions on a coarse grid, with ragged borders
+    coarse = [
+        rng.choices(string.ascii_uppercase, k=side // 4 + 2)
+        for _ in range(side // 4 + 2)
+    ]
+    grid = []
+    for r in range(side):
+        row = []
+        for c in range(side):
+            cr, cc = r // 4, c // 4
+            if rng.random() < 0.1:
+                cr, cc = cr + rng.randint(0, 1), cc + rng.randint(0, 1)
+            row.append(coarse[cr][cc])
+        grid.append(row)
+
+    return format_grid(grid)
+
+
+def generate_day13(rng, scale):
+    offset = 10000000000000  # added to the prizes in the second part
+    blocks = []
+    for _ in range(320 * scale):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        while ax * by == ay * bx:  # real machines never have collinear buttons
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        choice = rng.random()
+        if choice < 0.3:  # winnable in the first part, by construction
+            n, m = rng.randint(1, 100), rng.randint(1, 100)
+            px, py = n * ax + m * bx, n * ay + m * by
+        elif choice < 0.6:  # winnable in the second part, by construction
+            # the buttons move to either side of the diagonal, so that a far
+            # away prize near the diagonal can be reached with positive presses
+            ax, ay = max(ax, ay) + 1, min(ax, ay)
+            bx, by = min(bx, by), max(bx, by) + 1
+            x, y = offset + rng.randint(1000, 20000), offset + rng.randint(1000, 20000)
+            det = ax * by - ay * bx
+            n, m = round((x * by - y * bx) / det), round((ax * y - ay * x) / det)
+            px, py = n * ax + m * bx - offset, n * ay + m * by - offset
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        blocks.append(
+            f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}"
+        )
+    return "\n\n".join(blocks)
+
+
+def generate_day14(rng, scale, w=101, h=103):
+    # robots that form a filled triangle after some seconds, so that the
+    # second part terminates - note that, on larger scales, the grid gets
+    # so crowded that the heuristic triggers much earlier
+    t = rng.randint(1000, 9000)
+    tree = [(w // 2 + dx, h // 2 + dy) for dy in range(10) for dx in range(-dy, dy + 1)]
+
+    robots = []
+    for i in range(500 * scale):
+        vx, vy = rng.randint(-99, 99), rng.randint(-99, 99)
+        if i < len(tree):
+            x, y = tree[i]
+            px, py = (x - t * vx) % w, (y - t * vy) % h
+        else:
+            px, py = rng.randrange(w), rng.randrange(h)
+        robots.append(f"p={px},{py} v={vx},{vy}")
+
+    rng.shuffle(robots)
+    return "\n".join(robots)
+
+
+def generate_day15(rng, scale):
+    side = scaled_side(50, scale)
+
+    grid = []
+    for r in range(side):
+        row = []
+        for c in range(side):
+            if r in (0, side - 1) or c in (0, side - 1):
+                row.append("#")
+            else:
+                row.append(rng.choices("#O.", weights=[8, 26, 66])[0])
+        grid.append(row)
+    grid[side // 2][side // 2] = "@"
+
+    moves = "".join(rng.choices("<>^v", k=20000 * scale))
+    moves = "\n".join(moves[i : i + 1000] for i in range(0, len(moves), 1000))
+    return format_grid(grid) + "\n\n" + moves
+
+
+def generate_day16(rng, scale):
+    side = scaled_side(141, scale) | 1
+    grid = carve_maze(rng, side)
+
+    # knock out some walls, to get loops and multiple best paths
+    for r in range(1, side - 1):
+        for c in range(1, side - 1):
+            if grid[r][c] == "#" and (r + c) % 2 == 1 and rng.random() < 0.02:
+                grid[r][c] = "."
+
+    grid[side - 2][1], grid[1][side - 2] = "S", "E"
+    return format_grid(grid)
+
+
+def generate_day17(rng, scale):
+    b1, b2 = rng.randint(0, 7), rng.randint(0, 7)
+    program = [2, 4, 1, b1, 7, 5, 1, b2, 4, 4, 0, 3, 5, 5, 3, 0]
+    a = rng.getrandbits(48 * scale) | 1 << (48 * scale - 1)
+    return (
+        f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\n"
+        f"Program: {','.join(map(str, program))}"
+    )
+
+
+def generate_day18(rng, scale):
+    side = scaled_side(71, scale)
+    cells = [(x, y) for x in range(side) for y in range(side)]
+    cells = [xy for xy in cells if xy not in ((0, 0), (side - 1, side - 1))]
+    cells = rng.sample(cells, int(0.68 * side * side))
+
+    # the grid size is derived from the largest coordinates
+    for xy in ((side - 1, 0), (0, side - 1)):
+        if xy not in cells:
+            cells.insert(rng.randrange(len(cells)), xy)
+
+    return "\n".join(f"{x},{y}" for x, y in cells)
+
+
+def generate_day19(rng, scale):
+    patterns = set()
+    while len(patterns) < 447:
+        patterns.add("".join(rng.choices("wubrg", k=rng.randint(1, 8))))
+    patterns.discard("g")  # otherwise, every design is possible
+
+    patterns = sorted(patterns)
+    designs = []
+    for _ in range(400 * scale):
+        if rng.random() < 0.7:  # possible, by construction
+            design, length = "", rng.randint(20, 60)
+            while len(design) < length:
+                design += rng.choice(patterns)
+        else:
+            design = "".join(rng.choices("wubrg", k=rng.randint(20, 60)))
+        designs.append(design)
+
+    return ", ".join(patterns) + "\n\n" + "\n".join(designs)
+
+
+def generate_day20(rng, scale):
+    side = scaled_side(141, scale) | 1
+    grid = carve_maze(rng, side)
+
+    # the race track is the path between the two most distant cells
+    start = (1, 1)
+    _, parents = maze_distances(grid, start)
+    end = next(reversed(parents))
+    track = set()
+    pos = end
+    while pos is not None:
+        track.add(pos)
+        pos = parents[pos]
+
+    grid = [["." if (r, c) in track else "#" for c in range(side)] for r in range(side)]
+    grid[start[0]][start[1]], grid[end[0]][end[1]] = "S", "E"
+    return format_grid(grid)
+
+
+def generate_day21(rng, scale):
+    return "\n".join(f"{rng.randint(0, 999):03d}A" for _ in range(5 * scale))
+
+
+def generate_day22(rng, scale):
+    return "\n".join(str(rng.randint(1, 2**24 - 1)) for _ in range(2000 * scale))
+
+
+def generate_day23(rng, scale):
+    n = 520 * scale
+    names = unique_names(rng, n, string.ascii_lowercase, min_length=2)
+
+    edges = set()
+    for _ in range(n * 13 // 2):
+        a, b = rng.sample(names, 2)
+        edges.add((min(a, b), max(a, b)))
+
+    # plant a larger clique, to have a unique solution
+    clique = rng.sample(names, 13)
+    edges.update((a, b) for a in clique for b in clique if a < b)
+
+    lines = [f"{a}-{b}" if rng.random() < 0.5 else f"{b}-{a}" for a, b in edges]
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def generate_day24(rng, scale):
+    width = 45 * scale
+    digits = max(2, len(str(width)))
+    x, y, z = (lambda i, p=p: f"{p}{i:0{digits}d}" for p in "xyz")
+
+    consonants = (
+        string.ascii_lowercase.replace("x", "").replace("y", "").replace("z", "")
+    )
+    names = iter(unique_names(rng, 4 * width, consonants, min_length=3))
+
+    # a ripple-carry adder, with the output wires of each full adder
+    gates, adders = [], [dict(z=z(0), cout=next(names))]
+    gates.append(["XOR", x(0), y(0), z(0)])
+    gates.append(["AND", x(0), y(0), adders[0]["cout"]])
+    for i in range(1, width):
+        cin = adders[-1]["cout"]
+        cout = z(width) if i == width - 1 else next(names)
+        wire = dict(
+            xor1=next(names), and1=next(names), z=z(i), and2=next(names), cout=cout
+        )
+        gates.append(["XOR", x(i), y(i), wire["xor1"]])
+        gates.append(["AND", x(i), y(i), wire["and1"]])
+        gates.append(["XOR", wire["xor1"], cin, wire["z"]])
+        gates.append(["AND", wire["xor1"], cin, wire["and2"]])
+        gates.append(["OR", wire["and1"], wire["and2"], wire["cout"]])
+        adders.append(wire)
+
+    # swap four pairs of outputs, each within a single adder, so there are no cycles
+    outputs = {g[3]: g for g in gates}
+    for i in rng.sample(range(1, width - 1), 4):
+        a, b = rng.choice([("xor1", "and1"), ("z", "and2"), ("z", "cout")])
+        a, b = adders[i][a], adders[i][b]
+        outputs[a][3], outputs[b][3] = b, a
+
+    wires = [f"{w(i)}: {rng.randint(0, 1)}" for w in (x, y) for i in range(width)]
+    lines = []
+    for op, a, b, out in gates:
+        a, b = (a, b) if rng.random() < 0.5 else (b, a)
+        lines.append(f"{a} {op} {b} -> {out}")
+    rng.shuffle(lines)
+
+    return "\n".join(wires) + "\n\n" + "\n".join(lines)
+
+
+def generate_day25(rng, scale):
+    blocks = []
+    for _ in range(500 * scale):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = [[r <= h for h in heights] for r in range(1, 6)]
+        if rng.random() < 0.5:  # lock, filled from the top
+            rows = [[True] * 5] + rows + [[False] * 5]
+        else:  # key, filled from the bottom
+            rows = [[False] * 5] + rows[::-1] + [[True] * 5]
+        blocks.append(
+            "\n".join("".join("#" if f else "." for f in row) for row in rows)
+        )
+    return "\n\n".join(blocks)
+
+
+def scaled_side(side, scale):
+    # grow the side length, so that the number of cells grows by the scale
+    return round(side * math.sqrt(scale))
+
+
+def format_grid(grid):
+    return "\n".join("".join(map(str, row)) for row in grid)
+
+
+def unique_names(rng, n, alphabet, min_length=1):
+    length = max(min_length, math.ceil(math.log(2 * n, len(alphabet))))
+    names = set()
+    while len(names) < n:
+        names.add("".join(rng.choices(alphabet, k=length)))
+    return rng.sample(sorted(names), n)
+
+
+def carve_maze(rng, side):
+    # a perfect maze, with cells on odd coordinates, using a randomized dfs
+    grid = [["#"] * side for _ in range(side)]
+    grid[1][1] = "."
+    stack = [(1, 1)]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc) for dr, dc in [(0, 2), (0, -2), (2, 0), (-2, 0)]]
+        options = [(nr, nc) for nr, nc in options if 0 < nr < side and 0 < nc < side]
+        options = [(nr, nc) for nr, nc in options if grid[nr][nc] == "#"]
+        if not options:
+            stack.pop()
+            continue
+
+        nr, nc = rng.choice(options)
+        grid[(r + nr) // 2][(c + nc) // 2] = grid[nr][nc] = "."
+        stack.append((nr, nc))
+
+    return grid
+
+
+def maze_distances(grid, start):
+    # breadth-first search, where the last discovered cell is the most distant
+    distances, parents = {start: 0}, {start: None}
+    queue = deque([start])
+    while queue:
+        r, c = queue.popleft()
+        for pos in [(r, c + 1), (r, c - 1), (r + 1, c), (r - 1, c)]:
+            if grid[pos[0]][pos[1]] != "#" and pos not in distances:
+                distances[pos] = distances[r, c] + 1
+                parents[pos] = r, c
+                queue.append(pos)
+
+    return distances, parents
+
+
+def guard_leaves(grid, x, y):
+    dx, dy, seen = 0, -1, set()
+    while 0 <= x < len(grid[0]) and 0 <= y < len(grid):
+        if (x, y, dx, dy) in seen:
+            return False
+        seen.add((x, y, dx, dy))
+
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < len(grid[0]) and 0 <= ny < len(grid) and grid[ny][nx] == "#":
+            dx, dy = -dy, dx  # turn right
+        else:
+            x, y = nx, ny
+
+    return True
+
+
+GENERATORS = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+    15: generate_day15,
+    16: generate_day16,
+    17: generate_day17,
+    18: generate_day18,
+    19: generate_day19,
+    20: generate_day20,
+    21: generate_day21,
+    22: generate_day22,
+    23: generate_day23,
+    24: generate_day24,
+    25: generate_day25,
+}
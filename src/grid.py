@@ -0,0 +1,67 @@
+# Advent of Code 2024, Grids
+# (c) blu3r4y
+
+from collections import namedtuple
+
+import numpy as np
+
+# a grid is a flat array of bytes, surrounded by a border of sentinel cells,
+# so that neighbors of cells on the edge are never out of bounds - cells are
+# addressed by their integer index, and moving is a matter of adding offsets
+Grid = namedtuple("Grid", ["cells", "width", "height", "stride", "pad"])
+
+# the value of cells outside the map
+SENTINEL = 0
+
+
+def parse_grid(text, pad=1):
+    text = text.rstrip("\n")
+    width = text.find("\n") if "\n" in text else len(text)
+
+    # with a newline after each row, the text is a proper two-dimensional array
+    raw = np.frombuffer(text.encode() + b"\n", dtype=np.uint8)
+    if raw.size % (width + 1) != 0:
+        raise ValueError("all rows of the grid must have the same width")
+
+    cells = raw.reshape(-1, width + 1)[:, :width]
+    return from_array(cells, pad)
+
+
+def new_grid(width, height, fill=".", pad=1):
+    return from_array(np.full((height, width), ord(fill), dtype=np.uint8), pad)
+
+
+def from_array(cells, pad=1):
+    height, width = cells.shape
+    cells = np.pad(cells, pad, constant_values=SENTINEL).ravel()
+    return Grid(cells, width, height, width + 2 * pad, pad)
+
+
+def directions(grid):
+    # offsets for up, right, down and left - in clockwise order,
+    # so that turning right is moving to the next direction
+    return -grid.stride, 1, grid.stride, -1
+
+
+def index(grid, x, y):
+    return (y + grid.pad) * grid.stride + x + grid.pad
+
+
+def coords(grid, i):
+    y, x = divmod(i, grid.stride)
+    return x - grid.pad, y - grid.pad
+
+
+def find(grid, char):
+    return np.flatnonzero(grid.cells == ord(char))
+
+
+def to_array(grid):
+    # the cells as a two-dimensional array, without the border
+    cells = grid.cells.reshape(-1, grid.stride)
+    p = grid.pad
+    return cells[p : p + grid.height, p : p + grid.width]
+
+
+def format_grid(grid):
+    return "\n".join(row.tobytes().decode() for row in to_array(grid))
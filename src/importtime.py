@@ -0,0 +1,84 @@
+# Advent of Code 2024, Startup Benchmarks
+# (c) blu3r4y
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from runner import DAYS
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_startup(day, repeat=5, top=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import day{day}"],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        wall = time.perf_counter() - start
+
+        imports = parse_importtime(proc.stderr)
+        result = {
+            "day": day,
+            "startup_ms": wall * 1000,
+            "import_ms": imports[-1][1] / 1000,
+            "top": heaviest_imports(imports, top),
+        }
+
+        # the fastest run is the one with the least noise
+        if best is None or result["startup_ms"] < best["startup_ms"]:
+            best = result
+
+    return best
+
+
+def parse_importtime(stderr):
+    # lines look like "import time:   self [us] | cumulative | imported package",
+    # with nested imports indented by two spaces per level
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        _, cumulative_us, name = line.removeprefix("import time:").split("|")
+        level = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(cumulative_us), level))
+
+    return imports
+
+
+def heaviest_imports(imports, top):
+    # nested imports are listed before their parent, so the direct imports
+    # of the day are the ones since the previous top-level import
+    direct = []
+    for name, cumulative, level in reversed(imports[:-1]):
+        if level == 0:
+            break
+        if level == 1:
+            direct.append((name, cumulative))
+    direct.sort(key=lambda item: item[1], reverse=True)
+    return {name: cum / 1000 for name, cum in direct[:top]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="measure interpreter and import time")
+    parser.add_argument("days", nargs="*", type=int, default=DAYS)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="heaviest imports")
+    args = parser.parse_args()
+
+    for day in args.days:
+        print(json.dumps(measure_startup(day, args.repeat, args.top)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# Advent of Code 2024, Load Cache
+# (c) blu3r4y
+
+import argparse
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import shutil
+import sys
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# parsed inputs are cached on disk, unless AOC_LOAD_CACHE is set to "off"
+ENABLED = os.environ.get("AOC_LOAD_CACHE", "") != "off"
+CACHE_DIR = os.environ.get("AOC_LOAD_CACHE_DIR", os.path.join(SRC_DIR, "..", ".cache"))
+
+
+def cached_load(load, text, **kwargs):
+    if not ENABLED:
+        return load(text, **kwargs)
+
+    path = os.path.join(CACHE_DIR, f"{cache_key(load, text, kwargs)}.pickle")
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass  # missing, corrupt, or pickled from classes that changed since
+
+    data = load(text, **kwargs)
+    try:
+        blob = pickle.dumps(data, protocol=5)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return data  # not everything can be pickled
+
+    # write atomically, so that parallel runs never see partial files
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+
+    return data
+
+
+def cache_key(load, text, kwargs):
+    # the key changes with the input, the arguments, or the loader source
+    digest = hashlib.sha256()
+    digest.update(text.encode())
+    digest.update(repr(sorted(kwargs.items())).encode())
+    digest.update(source_fingerprint(load).encode())
+    return f"{load.__module__}-{digest.hexdigest()[:32]}"
+
+
+def source_fingerprint(fn, visited=None):
+    # the source of the function, and of all project functions, namedtuples
+    # and constants it refers to, recursively and across modules
+    visited = visited if visited is not None else set()
+    visited.add(fn)
+
+    parts = [inspect.getsource(fn)]
+    for name in sorted(code_names(fn.__code__)):
+        value = fn.__globals__.get(name)
+        if inspect.isfunction(value) and is_project(value):
+            if value not in visited:
+                parts.append(source_fingerprint(value, visited))
+        elif inspect.isclass(value) and is_project(value):
+            parts.append(f"{name} = {getattr(value, '_fields', value.__qualname__)!r}")
+        elif isinstance(value, re.Pattern):
+            parts.append(f"{name} = re.compile({value.pattern!r}, {value.flags})")
+        elif isinstance(value, (set, frozenset)):
+            # sorted, since the order of sets of strings changes between runs
+            parts.append(f"{name} = {sorted(value, key=repr)!r}")
+        elif isinstance(value, (int, float, complex, str, bytes, tuple, list, dict)):
+            parts.append(f"{name} = {value!r}")
+
+    return "\n".join(parts)
+
+
+def code_names(code):
+    # the global names of a function, including those of its comprehensions,
+    # generator expressions and lambdas, which have code objects of their own
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= code_names(const)
+    return names
+
+
+def is_project(value):
+    module = sys.modules.get(value.__module__)
+    path = getattr(module, "__file__", None)
+    return path is not None and os.path.dirname(os.path.abspath(path)) == SRC_DIR
+
+
+def clear():
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="manage the cache of parsed inputs")
+    parser.add_argument("--clear", action="store_true", help="delete all entries")
+    args = parser.parse_args()
+
+    if args.clear:
+        clear()
+
+    files = os.listdir(CACHE_DIR) if os.path.isdir(CACHE_DIR) else []
+    size = sum(os.path.getsize(os.path.join(CACHE_DIR, f)) for f in files)
+    print(
+        f"{len(files)} entries, {size / 1024:,.0f} kB in {os.path.abspath(CACHE_DIR)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
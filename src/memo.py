@@ -0,0 +1,217 @@
+# Advent of Code 2024, Memoization
+# (c) blu3r4y
+
+import sys
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+
+# the counters that are reported for each cache
+FIELDS = ("hits", "misses", "evictions", "entries", "bytes")
+
+# all caches by qualified function name, and the counters of the caches that
+# were already cleared, so that closures that are created anew in each run add up
+REGISTRY = defaultdict(list)
+CLEARED = defaultdict(lambda: [0] * len(FIELDS))
+
+# separates positional from keyword arguments in cache keys, and marks misses
+KWARGS, MISSING = object(), object()
+
+
+def memo(maxsize=None, maxbytes=None, policy="lru"):
+    # like functools.cache, but bounded by the number of entries and the
+    # (shallow) size of keys and values, evicting the least recently or the
+    # least frequently used entries first - entries larger than maxbytes on their
+    # own are not cached at all - caches that are only bounded by their number
+    # of entries in lru order are a functools.lru_cache, which is faster
+    if policy not in ("lru", "lfu"):
+        raise ValueError(f"unknown eviction policy {policy!r}")
+
+    def decorator(fn):
+        if policy == "lru" and maxbytes is None:
+            wrapper = lru_cache(maxsize)(fn)
+            wrapper.counters = lambda: lru_counters(wrapper)
+        else:
+            wrapper = bounded_cache(fn, maxsize, maxbytes, policy)
+
+        REGISTRY[f"{fn.__module__}.{fn.__qualname__}"].append(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def lru_counters(wrapper):
+    info = wrapper.cache_info()
+    evictions = info.misses - info.currsize  # each miss adds one entry
+    return [info.hits, info.misses, evictions, info.currsize, 0]
+
+
+def bounded_cache(fn, maxsize, maxbytes, policy):
+    values, sizes = {}, {}
+    order = LRUOrder() if policy == "lru" else LFUOrder()
+    counts = [0] * len(FIELDS)
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = args if not kwargs else args + (KWARGS,) + tuple(kwargs.items())
+        value = values.get(key, MISSING)
+        if value is not MISSING:
+            counts[0] += 1
+            order.touch(key)
+            return value
+
+        counts[1] += 1
+        value = fn(*args, **kwargs)
+        if key in values:
+            return value  # already added by a recursive call
+
+        size = 0
+        if maxbytes is not None:
+            size = sys.getsizeof(key) + sys.getsizeof(value)
+            if size > maxbytes:
+                return value  # never cached, it would evict everything else
+
+        # make room first, so that the new entry is never evicted right away
+        while values and (
+            (maxsize is not None and len(values) >= maxsize)
+            or (maxbytes is not None and counts[4] + size > maxbytes)
+        ):
+            evicted = order.evict()
+            del values[evicted]
+            counts[4] -= sizes.pop(evicted, 0)
+            counts[2] += 1
+
+        values[key] = value
+        order.add(key)
+        if size:
+            sizes[key] = size
+            counts[4] += size
+
+        counts[3] = len(values)
+        return value
+
+    def cache_clear():
+        values.clear()
+        sizes.clear()
+        order.clear()
+        counts[:] = [0] * len(FIELDS)
+
+    wrapper.cache_clear = cache_clear
+    wrapper.counters = lambda: list(counts)
+    return wrapper
+
+
+class LRUOrder:
+    def __init__(self):
+        self.keys = OrderedDict()
+
+    def add(self, key):
+        self.keys[key] = None
+
+    def touch(self, key):
+        self.keys.move_to_end(key)
+
+    def evict(self):
+        return self.keys.popitem(last=False)[0]
+
+    def clear(self):
+        self.keys.clear()
+
+
+class LFUOrder:
+    # keys are bucketed by their number of uses, and each bucket is in
+    # insertion order, so that ties are broken by recency
+
+    def __init__(self):
+        self.uses, self.buckets, self.min_uses = {}, defaultdict(OrderedDict), 0
+
+    def add(self, key):
+        self.uses[key] = 1
+        self.buckets[1][key] = None
+        self.min_uses = 1
+
+    def touch(self, key):
+        uses = self.uses[key]
+        bucket = self.buckets[uses]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[uses]
+            if self.min_uses == uses:
+                self.min_uses = uses + 1
+
+        self.uses[key] = uses + 1
+        self.buckets[uses + 1][key] = None
+
+    def evict(self):
+        bucket = self.buckets[self.min_uses]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self.buckets[self.min_uses]
+            self.min_uses = min(self.buckets, default=0)
+
+        del self.uses[key]
+        return key
+
+    def clear(self):
+        self.uses.clear()
+        self.buckets.clear()
+        self.min_uses = 0
+
+
+def stats(module=None):
+    # the counters of all caches, or of the caches of one module,
+    # added up over all caches of the same function since the last reset
+    prefix = f"{module}." if module else ""
+
+    result = {}
+    for name, wrappers in REGISTRY.items():
+        if not name.startswith(prefix):
+            continue
+
+        totals = CLEARED[name]
+        for wrapper in wrappers:
+            totals = add_counters(totals, wrapper.counters())
+
+        if totals[0] or totals[1]:  # skip caches that were never called
+            result[name] = dict(zip(FIELDS, totals))
+
+    return result
+
+
+def add_counters(a, b):
+    # the sizes are not added up, the caches don't exist at the same time
+    hits, misses, evictions = a[0] + b[0], a[1] + b[1], a[2] + b[2]
+    return [hits, misses, evictions, max(a[3], b[3]), max(a[4], b[4])]
+
+
+def reset_stats():
+    CLEARED.clear()
+
+
+def clear_all(keep_warm=False):
+    # with keep_warm, the caches of module-level functions are kept
+    for name, wrappers in REGISTRY.items():
+        for wrapper in wrappers:
+            if keep_warm and is_module_level(wrapper):
+                continue
+            CLEARED[name] = add_counters(CLEARED[name], wrapper.counters())
+            wrapper.cache_clear()
+
+        # forget about closures, they are not used after the run anymore
+        wrappers[:] = [w for w in wrappers if is_module_level(w)]
+
+
+def is_module_level(wrapper):
+    module = sys.modules.get(wrapper.__module__)
+    return getattr(module, wrapper.__name__, None) is wrapper
+
+
+@contextmanager
+def scoped():
+    # each run starts with empty caches and counters, and leaves no state behind
+    clear_all()
+    reset_stats()
+    try:
+        yield
+    finally:
+        clear_all()
@@ -0,0 +1,112 @@
+# Advent of Code 2024, Parallel Execution
+# (c) blu3r4y
+
+import os
+import sys
+from functools import cache
+
+# parallel execution is controlled by the AOC_PARALLEL environment variable:
+# - "off" (default) runs everything in the calling thread
+# - "on" uses threads on a free-threaded interpreter, and processes otherwise
+# - "threads" or "processes" forces one of them
+MODES = ("off", "on", "threads", "processes")
+MODE = os.environ.get("AOC_PARALLEL") or "off"
+
+# the parts that split their items into chunks
+PARALLEL_PARTS = [(2, 1), (2, 2), (6, 2), (7, 1), (7, 2), (13, 1), (13, 2)]
+PARALLEL_PARTS += [(19, 1), (19, 2), (22, 1), (22, 2)]
+
+# more chunks than workers, so that uneven chunks are balanced out
+CHUNKS_PER_WORKER = 4
+
+
+def is_free_threaded():
+    # the gil can only be disabled since python 3.13
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    return not is_gil_enabled()
+
+
+def resolve(mode=None):
+    mode = mode or MODE
+    if mode not in MODES:
+        raise ValueError(f"unknown parallel mode {mode!r}")
+    if mode == "on":
+        return "threads" if is_free_threaded() else "processes"
+    return mode
+
+
+def map_chunks(fn, items, *args, mode=None, workers=None):
+    # calls fn(chunk, *args) on chunks of the items and returns the results in
+    # order - for processes, fn and its arguments must be picklable, and the
+    # chunks must not share mutable state for threads
+    items = list(items)
+    mode = resolve(mode)
+    if mode == "off" or len(items) < 2:
+        return [fn(items, *args)]
+
+    workers = workers or os.cpu_count()
+    size = -(-len(items) // (CHUNKS_PER_WORKER * workers))
+    chunks = [items[i : i + size] for i in range(0, len(items), size)]
+
+    pool = executor(mode, workers)
+    futures = [pool.submit(fn, chunk, *args) for chunk in chunks]
+    return [f.result() for f in futures]
+
+
+@cache
+def executor(mode, workers):
+    # pools are kept alive, since starting processes costs more than most parts,
+    # and only imported here, since concurrent.futures is slow to import
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if mode == "threads":
+        return ThreadPoolExecutor(workers)
+    return ProcessPoolExecutor(workers)
+
+
+def compare(days, repeat=10, warmup=1, input_dir=None):
+    # the throughput of each parallel part in each mode, relative to serial
+    import bench
+    import parallel  # not __main__, whose mode the solvers don't see
+    from runner import get_input
+
+    for day in days:
+        text = get_input(day, input_dir)
+        for part in (p for d, p in PARALLEL_PARTS if d == day):
+            results = {}
+            for mode in ("off", "threads", "processes"):
+                parallel.MODE = mode
+                try:
+                    results[mode] = bench.benchmark(day, part, text, repeat, warmup)
+                finally:
+                    parallel.MODE = "off"
+
+            serial = results["off"]["median_ms"]
+            yield {
+                "day": day,
+                "part": part,
+                "free_threaded": is_free_threaded(),
+                "workers": os.cpu_count(),
+                **{f"{m}_ms": r["median_ms"] for m, r in results.items()},
+                **{f"{m}_speedup": serial / r["median_ms"] for m, r in results.items()},
+            }
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="compare serial, threads, processes")
+    parser.add_argument("days", nargs="*", type=int)
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="timed runs")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs")
+    parser.add_argument("-i", "--inputs", help="directory with dayN.txt input files")
+    args = parser.parse_args()
+
+    days = args.days or sorted({d for d, _ in PARALLEL_PARTS})
+    for result in compare(days, args.repeat, args.warmup, args.inputs):
+        print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# Advent of Code 2024, Profiling
+# (c) blu3r4y
+
+import argparse
+import cProfile
+import inspect
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+# parts to profile when they are called, e.g. "16" for both parts of day 16,
+# or "16.1,20.2" for the first part of day 16 and the second part of day 20
+PROFILE = os.environ.get("AOC_PROFILE", "")
+PROFILE_DIR = os.environ.get("AOC_PROFILE_DIR", "profiles")
+PROFILE_TOP = int(os.environ.get("AOC_PROFILE_TOP", 10))
+
+# seconds between checks for a new memory peak
+POLL_INTERVAL = 0.01
+
+
+def is_selected(fn, selection=PROFILE):
+    day = module_name(fn).removeprefix("day")
+    part = fn.__name__.removeprefix("part")
+    for item in filter(None, selection.split(",")):
+        sday, _, spart = item.strip().partition(".")
+        if sday == day and spart in ("", part):
+            return True
+    return False
+
+
+def module_name(fn):
+    # from the file name, since a day that is run directly is __main__
+    path = getattr(sys.modules.get(fn.__module__), "__file__", None)
+    if path is None:
+        return fn.__module__
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def profile(fn, outdir=PROFILE_DIR, top=PROFILE_TOP):
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with profiled(f"{module_name(fn)}.{fn.__name__}", outdir, top):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def profiled(name, outdir=PROFILE_DIR, top=PROFILE_TOP):
+    os.makedirs(outdir, exist_ok=True)
+
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    peak = PeakSnapshot()
+    peak.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        peak.stop()
+        tracemalloc.stop()
+
+        profiler.dump_stats(os.path.join(outdir, f"{name}.prof"))
+        report = format_report(name, profiler, peak, top)
+        with open(os.path.join(outdir, f"{name}.txt"), "w") as f:
+            f.write(report)
+        print(report, file=sys.stderr)
+
+
+class PeakSnapshot(threading.Thread):
+    # allocations are freed when the function returns, so a background
+    # thread snapshots the allocation sites whenever memory hits a new peak
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.snapshot, self.size = None, 0
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(POLL_INTERVAL):
+            self.check()
+
+    def check(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if self.snapshot is None or current > 1.1 * self.size:
+            self.snapshot, self.size = tracemalloc.take_snapshot(), current
+
+    def stop(self):
+        self.done.set()
+        self.join()
+        self.check()  # in case the function was very fast
+
+
+def format_report(name, profiler, peak, top):
+    out = io.StringIO()
+    out.write(f"=== {name}: top {top} functions by cumulative time\n")
+    stats = pstats.Stats(profiler, stream=out)
+    stats.sort_stats("cumulative").print_stats(top)
+
+    out.write(f"=== {name}: top {top} allocation sites at {peak.size / 1024:,.0f} kB\n")
+    for stat in peak.snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        site = f"{os.path.basename(frame.filename)}:{frame.lineno}"
+        out.write(f"{stat.size / 1024:12,.1f} kB {stat.count:10,d} blocks  {site}\n")
+
+    return out.getvalue()
+
+
+def main():
+    from runner import DAYS, PARTS, get_input, get_solver, load_part
+
+    parser = argparse.ArgumentParser(description="profile time and memory of parts")
+    parser.add_argument("days", nargs="+", type=int, choices=DAYS)
+    parser.add_argument("-p", "--part", type=int, choices=(1, 2), help="only one part")
+    parser.add_argument("-n", "--top", type=int, default=PROFILE_TOP)
+    parser.add_argument("-o", "--outdir", default=PROFILE_DIR)
+    parser.add_argument("-i", "--inputs", help="directory with dayN.txt input files")
+    args = parser.parse_args()
+
+    for day in args.days:
+        text = get_input(day, args.inputs)
+        for part in PARTS[day]:
+            if args.part not in (None, part):
+                continue
+
+            solver = inspect.unwrap(get_solver(day, part))
+            solver = profile(solver, args.outdir, args.top)
+            solver(load_part(day, part, text))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# Advent of Code 2024, Regression Gate
+# (c) blu3r4y
+
+import argparse
+import json
+import os
+import sys
+
+from bench import benchmark_all
+from runner import DAYS
+
+BASELINE = os.path.join(os.path.dirname(__file__), "..", "baseline.json")
+
+# the compared fields, with the differences below which changes are noise
+MIN_DELTAS = {"median_ms": 1.0, "peak_kb": 256.0}
+
+
+def compare(results, baseline, tolerance=0.2):
+    regressions = []
+    for r in results:
+        base = baseline.get(f"{r['day']}.{r['part']}")
+        if base is None:
+            continue  # not in the baseline yet
+
+        for field, min_delta in MIN_DELTAS.items():
+            old, new = base[field], r[field]
+            if new - old > max(tolerance * old, min_delta):
+                regressions.append((r["day"], r["part"], field, old, new))
+
+    return regressions
+
+
+def format_regression(day, part, field, old, new):
+    unit = {"ms": "ms", "kb": "kB"}[field.rpartition("_")[2]]
+    change = f"+{(new - old) / old:.0%}" if old else "new"
+    return f"day {day} part {part}: {field} {old:,.1f} -> {new:,.1f} {unit} ({change})"
+
+
+def load_baseline(path=BASELINE):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results, path=BASELINE, baseline=None):
+    # update the given parts, keep all others
+    baseline = dict(baseline or {})
+    for r in results:
+        baseline[f"{r['day']}.{r['part']}"] = {f: r[f] for f in MIN_DELTAS}
+
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fail on slower or larger parts")
+    parser.add_argument("days", nargs="*", type=int, default=DAYS)
+    parser.add_argument("-b", "--baseline", default=BASELINE)
+    parser.add_argument("-t", "--tolerance", type=float, default=0.2)
+    parser.add_argument("-n", "--repeat", type=int, default=10, help="timed runs")
+    parser.add_argument("-i", "--inputs", help="directory with dayN.txt input files")
+    parser.add_argument("--update", action="store_true", help="write the baseline")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline) if os.path.exists(args.baseline) else {}
+    if not baseline and not args.update:
+        parser.error(f"no baseline at {args.baseline}, create one with --update")
+
+    results = []
+    for result in benchmark_all(args.days, args.repeat, input_dir=args.inputs):
+        print(json.dumps(result), flush=True)
+        results.append(result)
+
+    if args.update:
+        save_baseline(results, args.baseline, baseline)
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(format_regression(*regression), file=sys.stderr)
+
+    print(f"{len(regressions)} regressions in {len(results)} parts", file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
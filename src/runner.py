@@ -0,0 +1,121 @@
+# Advent of Code 2024, Runner
+# (c) blu3r4y
+
+import argparse
+import importlib
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from functools import cache
+
+import memo
+from loadcache import cached_load
+from store import is_correct, is_stored_input, read_input
+
+DAYS = tuple(range(1, 26))
+
+# rough order of decreasing runtime (see the durations in the readme),
+# so that the slowest days are put on the pool first
+SLOWEST_FIRST = (17, 16, 23, 19, 12, 7, 20, 11, 5, 4, 18, 15, 6, 10, 25, 14, 9, 22)
+SLOWEST_FIRST += tuple(d for d in DAYS if d not in SLOWEST_FIRST)
+
+# the last day only has a single part
+PARTS = {day: (1,) if day == 25 else (1, 2) for day in DAYS}
+
+# extra arguments to load() for specific parts
+LOAD_KWARGS = {(15, 2): {"large": True}}
+
+# static setup that must run once per process before solving
+SETUP = {13: "generate_solvers", 21: "init"}
+
+
+@cache
+def get_module(day):
+    module = importlib.import_module(f"day{day}")
+    if day in SETUP:
+        getattr(module, SETUP[day])()
+    return module
+
+
+def get_input(day, input_dir=None):
+    return read_input(day, input_dir)
+
+
+def load_part(day, part, text):
+    # only the stored inputs are cached, generated or foreign ones are parsed
+    # each time, so that the cache doesn't grow with every input it sees
+    module, kwargs = get_module(day), LOAD_KWARGS.get((day, part), {})
+    if not is_stored_input(day, text):
+        return module.load(text, **kwargs)
+    return cached_load(module.load, text, **kwargs)
+
+
+def get_solver(day, part):
+    module = get_module(day)
+    return module.part1 if part == 1 else module.part2
+
+
+def run_part(day, part, text):
+    solver = get_solver(day, part)
+
+    # keep stdout clean for the json records
+    with redirect_stdout(sys.stderr), memo.scoped():
+        start = time.perf_counter()
+        data = load_part(day, part, text)
+        load_time = time.perf_counter() - start
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        answer = solver(data)
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        caches = memo.stats(f"day{day}")
+
+    return {
+        "day": day,
+        "part": part,
+        "answer": answer,
+        "correct": is_correct(day, part, answer, text),
+        "wall_ms": wall * 1000,
+        "cpu_ms": cpu * 1000,
+        "load_ms": load_time * 1000,
+        "caches": caches,
+    }
+
+
+def run_all(days, workers=None, input_dir=None):
+    days = [d for d in SLOWEST_FIRST if d in days]
+    inputs = {d: get_input(d, input_dir) for d in days}
+
+    with ProcessPoolExecutor(workers) as pool:
+        futures = dict()
+        for day in days:
+            for part in PARTS[day]:
+                future = pool.submit(run_part, day, part, inputs[day])
+                futures[future] = day, part
+
+        for future in as_completed(futures):
+            day, part = futures[future]
+            try:
+                yield future.result()
+            except Exception as e:
+                yield {"day": day, "part": part, "error": repr(e)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="solve many days on a process pool")
+    parser.add_argument("days", nargs="*", type=int, default=DAYS)
+    parser.add_argument("-w", "--workers", type=int, help="number of processes")
+    parser.add_argument("-i", "--inputs", help="directory with dayN.txt input files")
+    args = parser.parse_args()
+
+    failed = False
+    for record in run_all(args.days, args.workers, args.inputs):
+        failed |= "error" in record or record["correct"] is False
+        print(json.dumps(record), flush=True)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
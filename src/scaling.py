@@ -0,0 +1,170 @@
+# Advent of Code 2024, Scaling Benchmarks
+# (c) blu3r4y
+
+import argparse
+import inspect
+import json
+import math
+import multiprocessing
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stderr, redirect_stdout
+
+from bench import SKIP, clear_caches
+from generators import generate
+from runner import DAYS, PARTS, get_solver, load_part
+
+SCALES = (1, 10, 100, 1000)
+
+# memory that grows faster than the input to this power is flagged
+SUPERLINEAR = 1.2
+
+
+def measure(day, part, scale, seed=0):
+    text = generate(day, scale, seed)
+    solver = inspect.unwrap(get_solver(day, part))
+
+    data = load_part(day, part, text)
+    start = time.perf_counter()
+    solver(data)
+    elapsed = time.perf_counter() - start
+
+    # measure the memory in a second run, because tracing slows things down
+    clear_caches(day)
+    tracemalloc.start()
+    solver(load_part(day, part, text))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "day": day,
+        "part": part,
+        "scale": scale,
+        "size": len(text),
+        "wall_ms": elapsed * 1000,
+        "peak_kb": peak / 1024,
+        "max_rss_kb": max_rss_kb(),  # the process only ran this part
+    }
+
+
+def max_rss_kb():
+    # the high-water mark of the resident set size, which is in bytes on macos
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 if sys.platform == "darwin" else rss
+
+
+def memory_growth(results):
+    # the exponent of a power law fit of the peak memory over the input size,
+    # i.e. the slope of a least squares line through the points in log-log space
+    points = [
+        (math.log(r["size"]), math.log(r["peak_kb"]))
+        for r in results
+        if "error" not in r and r["peak_kb"] > 0
+    ]
+    if len(points) < 2:
+        return None
+
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    sxy = sum((x - mx) * (y - my) for x, y in points)
+    return sxy / sxx if sxx else None
+
+
+def measure_isolated(day, part, scale, timeout=None, max_memory=None):
+    # each measurement runs in a fresh process, which is killed on timeout
+    queue = multiprocessing.Queue()
+    args = (queue, day, part, scale, max_memory)
+    process = multiprocessing.Process(target=_measure_worker, args=args)
+    process.start()
+    process.join(timeout)
+
+    if process.is_alive():
+        process.kill()
+        process.join()
+        return {"day": day, "part": part, "scale": scale, "error": "timeout"}
+    if queue.empty():
+        error = f"exit code {process.exitcode}"
+        return {"day": day, "part": part, "scale": scale, "error": error}
+    return queue.get()
+
+
+def _measure_worker(queue, day, part, scale, max_memory):
+    if max_memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+    try:
+        with open(os.devnull, "w") as devnull:
+            with redirect_stdout(devnull), redirect_stderr(devnull):
+                queue.put(measure(day, part, scale))
+    except (Exception, RecursionError, MemoryError) as e:
+        queue.put({"day": day, "part": part, "scale": scale, "error": repr(e)})
+
+
+def plot(results, path):
+    import matplotlib.pyplot as plt
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+
+    for day in DAYS:
+        for part in PARTS[day]:
+            rs = [r for r in results if (r["day"], r["part"]) == (day, part)]
+            rs = [r for r in rs if "error" not in r]
+            if not rs:
+                continue
+
+            scales = [r["scale"] for r in rs]
+            label = f"day {day} part {part}"
+            ax1.plot(scales, [r["wall_ms"] for r in rs], marker="o", label=label)
+            ax2.plot(scales, [r["peak_kb"] for r in rs], marker="o", label=label)
+
+    ax1.set(xscale="log", yscale="log", xlabel="scale", ylabel="runtime [ms]")
+    ax2.set(xscale="log", yscale="log", xlabel="scale", ylabel="peak memory [kB]")
+    ax2.legend(loc="center left", bbox_to_anchor=(1, 0.5), fontsize="small")
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark on scaled inputs")
+    parser.add_argument("days", nargs="*", type=int, default=DAYS)
+    parser.add_argument("-s", "--scales", nargs="+", type=int, default=SCALES)
+    parser.add_argument("-t", "--timeout", type=float, default=60, help="seconds")
+    parser.add_argument("-m", "--max-memory", type=float, help="gigabytes")
+    parser.add_argument("--plot", help="save a plot to this file (needs matplotlib)")
+    args = parser.parse_args()
+
+    max_memory = None
+    if args.max_memory is not None:
+        max_memory = int(args.max_memory * 1024**3)
+
+    results = []
+    for day in args.days:
+        for part in PARTS[day]:
+            if (day, part) in SKIP:
+                continue
+
+            measured = []
+            for scale in sorted(args.scales):
+                result = measure_isolated(day, part, scale, args.timeout, max_memory)
+                print(json.dumps(result), flush=True)
+                measured.append(result)
+
+                if "error" in result:
+                    break  # larger scales won't do any better
+
+            results += measured
+            if (exponent := memory_growth(measured)) is not None:
+                growth = {"day": day, "part": part, "memory_exponent": exponent}
+                growth["superlinear"] = exponent > SUPERLINEAR
+                print(json.dumps(growth), flush=True)
+
+    if args.plot:
+        plot(results, args.plot)
+
+
+if __name__ == "__main__":
+    main()
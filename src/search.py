@@ -0,0 +1,97 @@
+# Advent of Code 2024, Graph Search
+# (c) blu3r4y
+
+import heapq
+import math
+from collections import deque
+
+# nodes are integer ids in range(size), e.g. the cell indices of a grid, and
+# graphs are given by a function that yields the successors of a node - for
+# weighted searches, as pairs of the successor and the cost to get there
+
+INF = math.inf
+
+
+def bfs(sources, neighbors, size):
+    # the distance field from the closest source, or -1 if unreachable
+    dist = [-1] * size
+    for node in sources:
+        dist[node] = 0
+
+    queue = deque(sources)
+    while queue:
+        node = queue.popleft()
+        for succ in neighbors(node):
+            if dist[succ] < 0:
+                dist[succ] = dist[node] + 1
+                queue.append(succ)
+
+    return dist
+
+
+def dijkstra(sources, neighbors, size, targets=()):
+    # the distance field from the closest source, and the predecessors of each
+    # node on all of its shortest paths - stops once all targets are settled
+    dist = [INF] * size
+    preds = [None] * size
+    for node in sources:
+        dist[node], preds[node] = 0, []
+
+    remaining = set(targets)
+    heap = [(0, node) for node in sources]
+    while heap:
+        d, node = heapq.heappop(heap)
+        if d > dist[node]:
+            continue  # outdated entry
+
+        remaining.discard(node)
+        if targets and not remaining:
+            break
+
+        for succ, cost in neighbors(node):
+            new = d + cost
+            if new < dist[succ]:
+                dist[succ], preds[succ] = new, [node]
+                heapq.heappush(heap, (new, succ))
+            elif new == dist[succ]:
+                preds[succ].append(node)
+
+    return dist, preds
+
+
+def astar(source, target, neighbors, heuristic):
+    # the distance from the source to the target, or None if unreachable
+    dist = {source: 0}
+
+    # on equal estimates, prefer the nodes that are further from the source,
+    # which is why the heap holds negated distances as a tiebreaker
+    heap = [(heuristic(source), 0, source)]
+    while heap:
+        _, negdist, node = heapq.heappop(heap)
+        d = -negdist
+        if node == target:
+            return d
+        if d > dist[node]:
+            continue  # outdated entry
+
+        for succ, cost in neighbors(node):
+            new = d + cost
+            if new < dist.get(succ, INF):
+                dist[succ] = new
+                heapq.heappush(heap, (new + heuristic(succ), -new, succ))
+
+    return None
+
+
+def shortest_path_nodes(preds, targets):
+    # all nodes on any shortest path to the given targets,
+    # by walking back the predecessor graph of dijkstra()
+    nodes = set(targets)
+    stack = list(targets)
+    while stack:
+        for pred in preds[stack.pop()] or ():
+            if pred not in nodes:
+                nodes.add(pred)
+                stack.append(pred)
+
+    return nodes
@@ -0,0 +1,106 @@
+# Advent of Code 2024, Input Store
+# (c) blu3r4y
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+from functools import cache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# puzzle inputs are personal, so they live in an ignored directory,
+# while the answers are derived from the solutions and are checked in
+INPUT_DIR = os.environ.get("AOC_INPUT_DIR", os.path.join(ROOT, "inputs"))
+ANSWERS = os.path.join(ROOT, "answers.json")
+
+YEAR = 2024
+
+
+def read_input(day, input_dir=None):
+    path = os.path.join(input_dir or INPUT_DIR, f"day{day}.txt")
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"no input at {path}, download it with: python src/store.py {day}"
+        ) from None
+
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""  # empty files can't be mapped
+
+        # decode straight from the mapped pages, without reading into a buffer
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                text = str(view, "utf-8")
+
+    return text.rstrip("\r\n")
+
+
+@cache
+def answers():
+    with open(ANSWERS) as f:
+        return json.load(f)
+
+
+def expected_answer(day, part):
+    known = answers().get(str(day), [])
+    return known[part - 1] if part <= len(known) else None
+
+
+def is_correct(day, part, answer, text=None):
+    # none if there is no known answer yet, or if the answer is for another
+    # input than the stored one, which is the only one the answers are known for
+    expected = expected_answer(day, part)
+    if expected is None or (text is not None and not is_stored_input(day, text)):
+        return None
+    return answer == expected
+
+
+def is_stored_input(day, text):
+    return input_digest(day) == hashlib.sha256(text.encode()).hexdigest()
+
+
+@cache
+def input_digest(day):
+    try:
+        return hashlib.sha256(read_input(day).encode()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def check_answer(day, part, answer):
+    expected = expected_answer(day, part)
+    assert expected in (None, answer), f"expected {expected!r}, got {answer!r}"
+
+
+def fetch(days, input_dir=None):
+    # the only place where aocd is used, so that it's only needed once
+    from aocd.models import Puzzle
+
+    input_dir = input_dir or INPUT_DIR
+    os.makedirs(input_dir, exist_ok=True)
+
+    for day in days:
+        path = os.path.join(input_dir, f"day{day}.txt")
+        if os.path.exists(path):
+            continue
+
+        with open(path, "w") as f:
+            f.write(Puzzle(year=YEAR, day=day).input_data)
+        print(f"downloaded {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="download missing puzzle inputs")
+    parser.add_argument("days", nargs="*", type=int, default=range(1, 26))
+    parser.add_argument("-i", "--inputs", help="directory with dayN.txt input files")
+    args = parser.parse_args()
+
+    fetch(args.days, args.inputs)
+
+
+if __name__ == "__main__":
+    main()
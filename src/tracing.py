@@ -0,0 +1,85 @@
+# Advent of Code 2024, Tracing
+# (c) blu3r4y
+
+import os
+import time
+from collections import deque
+from functools import wraps
+
+# tracing is controlled by the AOC_TRACE environment variable:
+# - "print" (default) prints a compact line per call, without full argument reprs
+# - "ring" only keeps the records in memory
+# - "off" doesn't wrap functions at all, so there is no overhead
+# - any other value is a file that json lines are appended to
+TRACE = os.environ.get("AOC_TRACE") or "print"
+
+# parts selected with AOC_PROFILE are also profiled, see profiling.py
+PROFILE = os.environ.get("AOC_PROFILE", "")
+
+# the most recent calls are always kept in a ring buffer, while tracing
+RECORDS = deque(maxlen=int(os.environ.get("AOC_TRACE_SIZE", 1000)))
+
+# strings with longer reprs are only described by their length
+MAX_REPR = 60
+
+
+def trace(fn):
+    if PROFILE:
+        from profiling import is_selected, profile
+
+        if is_selected(fn):
+            fn = profile(fn)
+
+    if TRACE == "off":
+        return fn
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        record = {
+            "call": f"{fn.__module__}.{fn.__qualname__}",
+            "args": [shape(a) for a in args],
+            "kwargs": {k: shape(v) for k, v in kwargs.items()},
+            "result": shape(result),
+            "ms": elapsed * 1000,
+        }
+        RECORDS.append(record)
+        emit(record)
+
+        return result
+
+    return wrapper
+
+
+def emit(record):
+    if TRACE == "print":
+        args = record["args"] + [f"{k}={v}" for k, v in record["kwargs"].items()]
+        call = f"{record['call']}({', '.join(args)})"
+        print(f"{record['ms']:10.2f} ms in {call} -> {record['result']}")
+    elif TRACE != "ring":
+        import json
+
+        with open(TRACE, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+def shape(value, depth=0):
+    # describe the value by its type and size, without building its full repr
+    name = type(value).__name__
+    if isinstance(value, int) and value.bit_length() > 64:
+        return f"{name}[{value.bit_length()} bits]"
+    if isinstance(value, str) and len(value) > MAX_REPR:
+        return f"{name}[{len(value)}]"
+    if isinstance(value, (int, float, complex, str, type(None))):
+        return repr(value)
+
+    if hasattr(value, "shape") and hasattr(value, "dtype"):
+        return f"{name}{tuple(value.shape)}:{value.dtype}"
+    if isinstance(value, tuple) and depth == 0 and len(value) <= 8:
+        return f"({', '.join(shape(v, depth + 1) for v in value)})"
+    if hasattr(value, "__len__"):
+        return f"{name}[{len(value)}]"
+    return name
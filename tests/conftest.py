@@ -0,0 +1,79 @@
+# Advent of Code 2024, Test Configuration
+# (c) blu3r4y
+
+import importlib
+import os
+import sys
+import timeit
+
+import pytest
+
+# the solutions import each other as top-level modules
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+sys.path.insert(0, os.path.abspath(SRC))
+
+# don't print a line per call, set before any day is imported
+os.environ.setdefault("AOC_TRACE", "off")
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "examples")
+
+# micro-benchmark results, reported at the end of the session
+TIMINGS = []
+
+
+def pytest_addoption(parser):
+    parser.addoption("--benchmark", action="store_true", help="run micro-benchmarks")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: per-function micro-benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    # benchmarks are slow and only informative, so they are opt-in
+    if config.getoption("--benchmark"):
+        return
+
+    skip = pytest.mark.skip(reason="needs --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not TIMINGS:
+        return
+
+    terminalreporter.section("micro-benchmarks")
+    for name, loops, best in TIMINGS:
+        terminalreporter.write_line(
+            f"{name:<48} {best * 1e6:12,.1f} µs  ({loops} loops)"
+        )
+
+
+def example(day, part=None):
+    # the examples of the puzzle statements, some of which differ per part
+    name = f"day{day}-{part}.txt" if part else f"day{day}.txt"
+    if part and not os.path.exists(os.path.join(EXAMPLES, name)):
+        name = f"day{day}.txt"
+
+    with open(os.path.join(EXAMPLES, name)) as f:
+        return f.read().rstrip("\r\n")
+
+
+def day(n):
+    return importlib.import_module(f"day{n}")
+
+
+@pytest.fixture
+def bench(request):
+    # times a call with enough loops for a total of at least 0.2 seconds,
+    # and keeps the best of five repetitions, like python -m timeit
+    def _bench(fn, *args, **kwargs):
+        timer = timeit.Timer(lambda: fn(*args, **kwargs))
+        loops, _ = timer.autorange()
+        best = min(timer.repeat(repeat=5, number=loops)) / loops
+        TIMINGS.append((f"{request.node.name} {fn.__name__}", loops, best))
+        return fn(*args, **kwargs)
+
+    return _bench
@@ -0,0 +1,95 @@
+# Advent of Code 2024, Micro-Benchmarks
+# (c) blu3r4y
+
+import pytest
+from conftest import day, example
+
+# run with: python -m pytest tests/test_benchmarks.py --benchmark
+pytestmark = pytest.mark.benchmark
+
+
+def test_interpret(bench):
+    program, a, b, c = day(17).load(example(17))
+    assert bench(day(17).interpret, program, a, b, c)
+
+
+def test_advance(bench):
+    assert bench(day(22).advance, 123) == 15887950
+
+
+def test_secret_sequence(bench):
+    assert bench(day(22).secret_sequence, 1, 2000)[-1] == 8685429
+
+
+def test_blink(bench):
+    # with cold caches, otherwise this only times a cache hit
+    blink = day(11).blink
+
+    def _blink():
+        blink.cache_clear()
+        return blink(125, 25) + blink(17, 25)
+
+    assert bench(_blink) == 55312
+
+
+def test_eval_gate(bench):
+    wires, gates = day(24).load(example(24))
+    assert bench(day(24).eval_gate, "z02", wires, gates) == 1
+
+
+def test_is_guard_looping(bench):
+    grid, guard = day(6).load(example(6))
+    cells, offsets = bytearray(grid.cells), day(6).directions(grid)
+    assert not bench(day(6).is_guard_looping, cells, guard, offsets)
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 7])
+def test_load(n, bench):
+    assert bench(day(n).load, example(n))
+
+
+@pytest.fixture(scope="module")
+def day1_input():
+    from generators import generate
+
+    return generate(1, 100)
+
+
+@pytest.mark.parametrize("version", ["numpy", "loop"])
+def test_day1(version, day1_input, bench):
+    # the vectorized solvers against the plain python ones, on 100k lines
+    module = day(1)
+    if version == "numpy":
+        left, right = bench(module.load, day1_input)
+        part1, part2 = module.part1, module.part2
+    else:
+        left, right = map(list, bench(module.load_lists, day1_input))
+        part1, part2 = module.part1_loop, module.part2_loop
+
+    assert bench(part1, (left, right)) == 9237231
+    assert bench(part2, (left, right)) == 7790196782
+
+
+@pytest.mark.parametrize("levels", [1000, 4000])
+def test_is_save_dampened(levels, bench):
+    # one level out of place in the middle, the worst case for trying all removals
+    report = list(range(levels))
+    report[levels // 2] += 10
+    assert bench(day(2).is_save_dampened, tuple(report))
+
+
+@pytest.mark.parametrize("version", ["loop", "batched"])
+def test_day2(version, bench):
+    # the per-report solvers against the vectorized ones, on 100k reports
+    from generators import generate
+
+    module, text = day(2), generate(2, 100)
+    if version == "loop":
+        load, part1, part2 = module.load, module.part1, module.part2
+    else:
+        load = module.load_batched
+        part1, part2 = module.part1_batched, module.part2_batched
+
+    data = bench(load, text)
+    assert bench(part1, data) == 60412
+    assert bench(part2, data) == 83080
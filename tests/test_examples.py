@@ -0,0 +1,148 @@
+# Advent of Code 2024, Example Tests
+# (c) blu3r4y
+
+import pytest
+from conftest import day, example
+
+# the answers of the examples in the puzzle statements, by day and part
+ANSWERS = {
+    (1, 1): 11,
+    (1, 2): 31,
+    (2, 1): 2,
+    (2, 2): 4,
+    (3, 1): 161,
+    (3, 2): 48,
+    (4, 1): 18,
+    (4, 2): 9,
+    (5, 1): 143,
+    (5, 2): 123,
+    (6, 1): 41,
+    (6, 2): 6,
+    (7, 1): 3749,
+    (7, 2): 11387,
+    (8, 1): 14,
+    (8, 2): 34,
+    (9, 1): 1928,
+    (9, 2): 2858,
+    (10, 1): 36,
+    (10, 2): 81,
+    (11, 1): 55312,
+    (11, 2): 65601038650482,
+    (12, 1): 1930,
+    (12, 2): 1206,
+    (13, 1): 480,
+    (13, 2): 875318608908,
+    (14, 1): 12,
+    (15, 1): 10092,
+    (15, 2): 9021,
+    (16, 1): 7036,
+    (16, 2): 45,
+    (18, 1): 22,
+    (18, 2): "6,1",
+    (19, 1): 6,
+    (19, 2): 16,
+    (21, 1): 126384,
+    (21, 2): 154115708116294,
+    (22, 1): 37327623,
+    (22, 2): 23,
+    (23, 1): 7,
+    (23, 2): "co,de,ka,ta",
+    (24, 1): 4,
+    (25, 1): 3,
+}
+
+# the examples that are smaller than the real inputs in more than their data
+PART_KWARGS = {(14, 1): {"w": 11, "h": 7}, (18, 1): {"length": 12}}
+LOAD_KWARGS = {(15, 2): {"large": True}}
+
+
+@pytest.mark.parametrize("n, part", sorted(ANSWERS))
+def test_example(n, part):
+    module = day(n)
+    if n == 21:
+        module.init()
+
+    data = module.load(example(n, part), **LOAD_KWARGS.get((n, part), {}))
+    solver = module.part1 if part == 1 else module.part2
+    assert solver(data, **PART_KWARGS.get((n, part), {})) == ANSWERS[n, part]
+
+
+def test_example_day17():
+    # the second part is a randomized search, so only the first one is checked
+    data = day(17).load(example(17))
+    assert day(17).part1(data) == "4,6,3,5,6,3,5,2,1,0"
+
+
+@pytest.mark.parametrize(
+    "max_skip, min_gain, cheats", [(2, 20, 5), (2, 64, 1), (20, 76, 3), (20, 74, 7)]
+)
+def test_example_day20(max_skip, min_gain, cheats):
+    # the example only counts the cheats above a much smaller gain
+    grid, start, end = day(20).load(example(20))
+    assert day(20).solve(grid, start, end, max_skip, min_gain) == cheats
+
+
+@pytest.mark.parametrize("mode", ["threads", "processes"])
+@pytest.mark.parametrize("n", [2, 6, 7, 13, 19, 22])
+def test_example_parallel(n, mode, monkeypatch):
+    # the chunked parts give the same answers on any pool
+    monkeypatch.setattr("parallel.MODE", mode)
+    module = day(n)
+    for part, solver in [(1, module.part1), (2, module.part2)]:
+        assert solver(module.load(example(n, part))) == ANSWERS[n, part]
+
+
+@pytest.mark.parametrize("lines", [1, 2, 1000])
+def test_example_day1_streaming(lines, tmp_path):
+    # small chunks, so that many runs are merged
+    path = tmp_path / "day1.txt"
+    path.write_text(example(1))
+    assert day(1).part1_streaming(path, lines) == ANSWERS[1, 1]
+    assert day(1).part2_streaming(path, lines) == ANSWERS[1, 2]
+
+
+@pytest.mark.parametrize("newline", ["", "\n"])
+def test_example_day2_batched(newline):
+    data = day(2).load_batched(example(2) + newline)
+    assert day(2).part1_batched(data) == ANSWERS[2, 1]
+    assert day(2).part2_batched(data) == ANSWERS[2, 2]
+
+
+def test_day2_batched_lengths():
+    # reports of different lengths, so that the shorter ones are padded
+    text = "1 2 4 7 8 9 12 13\n5\n9 7\n1 5 6\n3 4 5 1 6\n1 2 3 4 5 6 7 20 8\n8 4\n"
+    reports, batched = day(2).load(text), day(2).load_batched(text)
+    assert batched[1].tolist() == [8, 1, 2, 3, 5, 9, 2]
+    assert day(2).part1_batched(batched) == day(2).part1(reports) == 3
+    assert day(2).part2_batched(batched) == day(2).part2(reports) == 7
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 5, 16, 1000])
+def test_example_day3_streaming(chunk_bytes, tmp_path):
+    # tiny chunks, so that instructions and switches straddle their boundaries
+    for part in (1, 2):
+        path = tmp_path / f"day3-{part}.txt"
+        path.write_text(example(3, part))
+        solver = getattr(day(3), f"part{part}_streaming")
+        assert solver(path, chunk_bytes) == ANSWERS[3, part]
+
+
+def test_day3_streaming_empty(tmp_path):
+    path = tmp_path / "day3.txt"
+    path.write_text("")
+    assert day(3).part1_streaming(path) == day(3).part2_streaming(path) == 0
+
+
+@pytest.mark.parametrize(
+    "text, xmas, x_mas",
+    [
+        ("XMASAMX", 2, 0),
+        ("X\nM\nA\nS", 1, 0),
+        ("SAMX\n....", 1, 0),
+        ("M.S\n.A.\nM.S\n...", 0, 1),
+        ("M.M.\n.A..\nS.S.", 0, 1),
+    ],
+)
+def test_day4_non_square(text, xmas, x_mas):
+    grid = day(4).load(text)
+    assert (day(4).part1(grid), day(4).part2(grid)) == (xmas, x_mas)
@@ -0,0 +1,79 @@
+# Advent of Code 2024, Helper Tests
+# (c) blu3r4y
+
+import re
+
+import pytest
+from conftest import day, example
+
+
+@pytest.mark.parametrize(
+    "program, a, output",
+    [
+        ([5, 0, 5, 1, 5, 4], 10, [0, 1, 2]),
+        ([0, 1, 5, 4, 3, 0], 2024, [4, 2, 5, 6, 7, 7, 7, 7, 3, 1, 0]),
+        ([0, 3, 5, 4, 3, 0], 117440, [0, 3, 5, 4, 3, 0]),  # a quine
+    ],
+)
+def test_interpret(program, a, output):
+    assert day(17).interpret(program, a, 0, 0) == output
+
+
+def test_advance():
+    secrets, s = [], 123
+    for _ in range(10):
+        s = day(22).advance(s)
+        secrets.append(s)
+
+    assert secrets == [
+        15887950,
+        16495136,
+        527345,
+        704524,
+        1553684,
+        12683156,
+        11100544,
+        12249484,
+        7753432,
+        5908254,
+    ]
+
+
+@pytest.mark.parametrize(
+    "stone, result", [(0, 1), (1, 2024), (10, (1, 0)), (99, (9, 9)), (999, 2021976)]
+)
+def test_transform(stone, result):
+    assert day(11).transform(stone) == result
+
+
+@pytest.mark.parametrize("n, stones", [(1, 3), (2, 4), (3, 5), (6, 22), (25, 55312)])
+def test_blink(n, stones):
+    assert day(11).blink(125, n) + day(11).blink(17, n) == stones
+
+
+@pytest.mark.parametrize("name, value", [("z00", 0), ("z01", 0), ("z02", 1)])
+def test_eval_gate(name, value):
+    wires, gates = day(24).load(example(24))
+    assert day(24).eval_gate(name, wires, gates) == value
+
+
+@pytest.mark.parametrize(
+    "n, name, value",
+    [(14, "NUMBER", re.compile(r"\d+")), (15, "ENLARGED", {})],
+)
+def test_source_fingerprint(n, name, value, monkeypatch):
+    # constants used by the loaders, even in comprehensions, are part of the key
+    from loadcache import source_fingerprint
+
+    before = source_fingerprint(day(n).load)
+    monkeypatch.setattr(day(n), name, value)
+    assert source_fingerprint(day(n).load) != before
+
+
+@pytest.mark.parametrize("line", ["[1]", '"ping"', "null", "{"])
+def test_respond_to_bad_requests(line):
+    # answered with an error, instead of stopping the daemon
+    from daemon import respond
+
+    response = respond(line, {"running": True})
+    assert response["id"] is None and "error" in response
@@ -0,0 +1,127 @@
+# Advent of Code 2024, Memoization Tests
+# (c) blu3r4y
+
+import sys
+
+import pytest
+
+import memo
+
+
+@memo.memo(maxsize=4)
+def cube(x):
+    return x * x * x
+
+
+def make_cache(**kwargs):
+    calls = []
+
+    @memo.memo(**kwargs)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    return square, calls
+
+
+def counters(fn):
+    return dict(zip(memo.FIELDS, fn.counters()))
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"maxbytes": 10**6}])
+def test_lru_evicts_least_recently_used(kwargs):
+    # with and without a byte limit, i.e. a functools.lru_cache or not
+    square, calls = make_cache(maxsize=2, **kwargs)
+    square(1), square(2), square(1), square(3)  # evicts 2, which is older
+    square(1), square(2)
+
+    assert calls == [1, 2, 3, 2]
+    hits, misses, evictions, entries, _ = square.counters()
+    assert (hits, misses, evictions, entries) == (2, 4, 2, 2)
+
+
+def test_lfu_evicts_least_frequently_used():
+    square, calls = make_cache(maxsize=2, policy="lfu")
+    square(1), square(1), square(2), square(3)  # evicts 2, which is used less
+    square(1), square(2)
+
+    assert calls == [1, 2, 3, 2]
+
+
+def test_lfu_breaks_ties_by_recency():
+    square, calls = make_cache(maxsize=2, policy="lfu")
+    square(1), square(2), square(3)  # both are used once, 1 is older
+    square(2), square(1)
+
+    assert calls == [1, 2, 3, 1]
+
+
+def test_bytes_are_accounted():
+    size = sys.getsizeof((1000,)) + sys.getsizeof(1000 * 1000)
+    square, calls = make_cache(maxbytes=2 * size)
+    square(1000), square(1001)
+    assert counters(square)["bytes"] == 2 * size
+
+    square(1002)  # evicts the oldest entry to stay within the limit
+    assert counters(square)["bytes"] == 2 * size
+    assert counters(square)["evictions"] == 1
+
+    square.cache_clear()
+    assert counters(square)["bytes"] == 0
+
+
+def test_entries_larger_than_maxbytes_are_not_cached():
+    square, calls = make_cache(maxbytes=10)
+    square(7), square(7)
+
+    assert calls == [7, 7]
+    assert counters(square)["bytes"] == 0
+    assert counters(square)["entries"] == 0
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        memo.memo(policy="fifo")
+
+
+def test_counters_add_up_across_clear_all():
+    name = f"{__name__}.cube"
+
+    with memo.scoped():
+        cube(1), cube(1)
+        memo.clear_all()  # folds the counters of the cleared cache
+        cube(1), cube(2), cube(2)
+        assert memo.stats(__name__)[name] == {
+            "hits": 2,
+            "misses": 3,
+            "evictions": 0,
+            "entries": 2,  # the largest size, not the sum
+            "bytes": 0,
+        }
+
+    # the next scope starts with empty caches and counters
+    with memo.scoped():
+        assert name not in memo.stats(__name__)
+        assert cube.cache_info().currsize == 0
+
+
+def test_counters_of_closures_add_up():
+    # a new closure for each run, like the matchers of day 19
+    name = f"{__name__}.make_cache.<locals>.square"
+
+    with memo.scoped():
+        for _ in range(3):
+            square, _ = make_cache()
+            square(1), square(1)
+        assert memo.stats(__name__)[name]["hits"] == 3
+        assert memo.stats(__name__)[name]["misses"] == 3
+
+
+def test_keep_warm_keeps_module_level_caches():
+    with memo.scoped():
+        square, _ = make_cache()
+        cube(1), square(1)
+        memo.clear_all(keep_warm=True)
+
+        assert cube.cache_info().currsize == 1
+        assert square.counters()[3] == 0